@@ -21,7 +21,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from examples.tests.test_utils import TestResult
+from examples.tests.test_utils import TestResult, summarize
 
 
 def run_comprehensive_tests():
@@ -83,9 +83,7 @@ def run_comprehensive_tests():
     print("=" * 80)
     
     # Count results
-    total_passed = sum(1 for r in all_results if r.passed == True)
-    total_failed = sum(1 for r in all_results if r.passed == False)
-    total_skipped = sum(1 for r in all_results if r.passed is None)
+    total_passed, total_failed, total_skipped = summarize(all_results)
     total_tests = len(all_results)
     
     # Module summary
@@ -95,9 +93,7 @@ def run_comprehensive_tests():
         if not results:
             status = "⊘ SKIPPED"
         else:
-            passed = sum(1 for r in results if r.passed == True)
-            failed = sum(1 for r in results if r.passed == False)
-            skipped = sum(1 for r in results if r.passed is None)
+            passed, failed, skipped = summarize(results)
             total = passed + failed
             
             if failed == 0 and skipped == 0:
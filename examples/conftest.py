@@ -0,0 +1,10 @@
+"""Pytest configuration for the examples."""
+
+import sys
+from pathlib import Path
+
+try:
+    import wall_library  # noqa: F401
+except ImportError:
+    # Not installed (`pip install -e .`): make the source checkout importable
+    sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,38 @@
+"""Shared OpenAI clients for the examples.
+
+Each client is built once per process and keeps its HTTP connection pool,
+so repeated calls reuse warm keep-alive connections instead of paying a new
+TCP/TLS handshake.
+"""
+
+import functools
+import os
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+# Connection pool shared by all requests made through one client
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+
+@functools.cache
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """Get the shared synchronous OpenAI client."""
+    return OpenAI(
+        api_key=api_key or os.environ["OPENAI_API_KEY"],
+        http_client=httpx.Client(limits=_POOL_LIMITS),
+    )
+
+
+@functools.cache
+def get_async_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Get the shared async OpenAI client.
+
+    The underlying connections belong to the event loop that first uses them,
+    so share this client within a single ``asyncio.run``.
+    """
+    return AsyncOpenAI(
+        api_key=api_key or os.environ["OPENAI_API_KEY"],
+        http_client=httpx.AsyncClient(limits=_POOL_LIMITS),
+    )
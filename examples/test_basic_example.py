@@ -20,28 +20,27 @@ class LengthValidator(Validator):
     
     def _validate(self, value: Any, metadata: dict) -> PassResult | FailResult:
         """Validate value length."""
-        from wall_library.classes.validation.validation_result import PassResult, FailResult
-        
         if not isinstance(value, str):
             return FailResult(
                 error_message=f"Value must be a string, got {type(value).__name__}",
                 metadata=metadata,
             )
         
+        # Single range check on the success path; messages are only built on failure
         length = len(value)
+        if self.min_length <= length <= self.max_length:
+            return PassResult(metadata=metadata)
+        
         if length < self.min_length:
             return FailResult(
                 error_message=f"Value too short. Minimum length: {self.min_length}, got: {length}",
                 metadata=metadata,
             )
         
-        if length > self.max_length:
-            return FailResult(
-                error_message=f"Value too long. Maximum length: {self.max_length}, got: {length}",
-                metadata=metadata,
-            )
-        
-        return PassResult(metadata=metadata)
+        return FailResult(
+            error_message=f"Value too long. Maximum length: {self.max_length}, got: {length}",
+            metadata=metadata,
+        )
 
 
 def main():
@@ -5,26 +5,48 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def mock_llm_cot_approve(prompt: str) -> str:
-    """Mock LLM response simulating Chain of Thought approval."""
-    print(f"\n[Mock LLM Input]:\n{prompt[:100]}...\n")
-    return """
+# Canned CoT replies, shared by every call to the mocks
+_APPROVE_REPLY = """
     1. Intent: User wants to share data.
     2. Context: Data sharing is allowed if encrypted.
     3. Verdict: This seems safe because encryption is mentioned.
     final_answer: yes
     """
 
-def mock_llm_cot_reject(prompt: str) -> str:
-    """Mock LLM response simulating Chain of Thought rejection."""
-    print(f"\n[Mock LLM Input]:\n{prompt[:100]}...\n")
-    return """
+_REJECT_REPLY = """
     1. Intent: User wants to delete the database.
     2. Context: Usage is read-only.
     3. Verdict: This violates the read-only constraint.
     final_answer: no
     """
 
+_BATCH_REPLY = """
+    Row 1: Sharing encrypted data is allowed by the protocols.
+    Row 2: Deleting the database violates the read-only constraint.
+    final_answer_1: yes
+    final_answer_2: no
+    """
+
+# Prompts received by the single-query mocks, in call order
+RECORDED_PROMPTS = []
+
+def mock_llm_cot_approve(prompt: str) -> str:
+    """Mock LLM response simulating Chain of Thought approval."""
+    RECORDED_PROMPTS.append(prompt)
+    logger.debug("[Mock LLM Input]: %.100s...", prompt)
+    return _APPROVE_REPLY
+
+def mock_llm_cot_reject(prompt: str) -> str:
+    """Mock LLM response simulating Chain of Thought rejection."""
+    RECORDED_PROMPTS.append(prompt)
+    logger.debug("[Mock LLM Input]: %.100s...", prompt)
+    return _REJECT_REPLY
+
+def mock_llm_cot_batch(prompt: str) -> str:
+    """Mock LLM response simulating row-marshaled Chain of Thought verdicts."""
+    logger.debug("[Mock LLM Input]: %.100s...", prompt)
+    return _BATCH_REPLY
+
 def test_llm_strategy():
     print("----------------------------------------------------------------")
     print("Testing ContextManager with strategy='llm_check'")
@@ -60,6 +82,29 @@ def test_llm_strategy():
     print(f"Is Valid: {is_valid_reject}")
     assert is_valid_reject is False, "Should be invalid based on 'final_answer: no'"
 
+    # Both prompts share the context prefix; only the query suffix differs
+    approve_prompt, reject_prompt = RECORDED_PROMPTS[-2:]
+    prefix = approve_prompt[:approve_prompt.index(query)]
+    assert prefix, "Query should follow a non-empty context prefix"
+    assert reject_prompt.startswith(prefix), "Consecutive prompts should share an identical prefix"
+
+    # 3. Test Batched Approval + Rejection in a single LLM call
+    print("\n--- Test 3: Batch (Expected [True, False]) ---")
+    calls = []
+
+    def counting_batch_llm(prompt: str) -> str:
+        calls.append(prompt)
+        return mock_llm_cot_batch(prompt)
+
+    results = cm.check_context_batch(
+        [query, bad_query],
+        strategy="llm_check",
+        llm_call=counting_batch_llm
+    )
+    print(f"Results: {results}")
+    assert results == [True, False], "Should map final_answer_1/final_answer_2 to each row"
+    assert len(calls) == 1, "Both queries should share a single LLM call"
+
     print("\n[SUCCESS] LLM Strategy tests passed!")
 
 if __name__ == "__main__":
@@ -1,12 +1,13 @@
 """Test example with OpenAI API."""
 
 import os
+import asyncio
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-from wall_library import WallGuard
+from wall_library import AsyncGuard
 from pydantic import BaseModel, Field
 
 try:
@@ -23,6 +24,10 @@ class Pet(BaseModel):
     name: str = Field(description="a unique pet name")
 
 
+# Upper bound on in-flight requests, to stay under the account's rate limit
+MAX_CONCURRENT_REQUESTS = 4
+
+
 def main():
     """Test structured output with OpenAI."""
     if not OPENAI_AVAILABLE:
@@ -38,41 +43,51 @@ def main():
     openai.api_key = api_key
 
     print("Creating guard with Pydantic model...")
-    prompt = "What kind of pet should I get and what should I name it? Give me one recommendation."
+    prompts = [
+        "What kind of pet should I get and what should I name it? Give me one recommendation.",
+        "I live in a small apartment. What pet should I get and what should I name it?",
+        "I have a big garden. What pet should I get and what should I name it?",
+    ]
     
-    guard = WallGuard.for_pydantic(output_class=Pet, prompt=prompt)
+    guard = AsyncGuard.for_pydantic(output_class=Pet, prompt=prompts[0])
     print("✓ Guard created successfully")
 
-    print("\nCalling OpenAI with guard...")
+    print(f"\nCalling OpenAI with guard for {len(prompts)} prompts concurrently...")
     try:
-        # Note: This uses a simplified OpenAI call
-        # In production, you would use the full OpenAI client
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
-
-        # Create a simple wrapper for the LLM API
-        def llm_api_call(prompt: str, **kwargs):
-            """Wrapper for OpenAI API call."""
-            response = client.chat.completions.create(
+        from openai_clients import get_async_openai_client
+        client = get_async_openai_client(api_key)
+
+        # Create an async wrapper for the LLM API so requests overlap
+        async def async_llm_api_call(prompt: str, **kwargs):
+            """Wrapper for async OpenAI API call."""
+            response = await client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 **kwargs
             )
             return response.choices[0].message.content
 
+        async def run_all():
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            async def run_one(prompt: str):
+                async with semaphore:
+                    return await guard(llm_api=async_llm_api_call, prompt=prompt)
+
+            return await asyncio.gather(*(run_one(p) for p in prompts))
+
         # Use guard with OpenAI
-        raw_output, validated_output, outcome = guard(
-            llm_api=llm_api_call,
-            prompt=prompt,
-        )
-
-        print(f"\n✓ Raw output: {raw_output}")
-        print(f"✓ Validated output: {validated_output}")
-        print(f"✓ Validation passed: {outcome.validation_passed}")
-
-        if validated_output:
-            print(f"\n📝 Pet Type: {validated_output.get('pet_type', 'N/A')}")
-            print(f"📝 Pet Name: {validated_output.get('name', 'N/A')}")
+        results = asyncio.run(run_all())
+
+        for prompt, (raw_output, validated_output, outcome) in zip(prompts, results):
+            print(f"\n❓ Prompt: {prompt}")
+            print(f"✓ Raw output: {raw_output}")
+            print(f"✓ Validated output: {validated_output}")
+            print(f"✓ Validation passed: {outcome.validation_passed}")
+
+            if isinstance(validated_output, dict):
+                print(f"📝 Pet Type: {validated_output.get('pet_type', 'N/A')}")
+                print(f"📝 Pet Name: {validated_output.get('name', 'N/A')}")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
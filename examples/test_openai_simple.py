@@ -46,7 +46,8 @@ except Exception as e:
 
 # Test OpenAI connection (simple test without full guard execution)
 try:
-    client = OpenAI(api_key=api_key)
+    from openai_clients import get_openai_client
+    client = get_openai_client(api_key)
     print("✓ OpenAI client created")
     
     print("\n📡 Testing OpenAI API connection...")
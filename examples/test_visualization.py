@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 """Test visualization module for Wall Library."""
 
-import sys
 import os
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
 
-from wall_library.visualization import WallVisualizer
-from wall_library.nlp import ContextManager
+try:
+    import wall_library  # noqa: F401
+except ImportError:
+    # Not installed (`pip install -e .`): fall back to the source checkout
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+# WallVisualizer pulls in matplotlib/plotly/wordcloud/seaborn and ContextManager
+# pulls in the NLP stack, so both are imported on first use rather than at load.
+def _viz(output_dir: str):
+    """WallVisualizer for output_dir, imported and built on first use."""
+    from wall_library.visualization import WallVisualizer
+    return WallVisualizer(output_dir=output_dir)
 
 
 def test_visualization():
@@ -22,7 +32,7 @@ def test_visualization():
     output_dir = "visualizations_test"
     os.makedirs(output_dir, exist_ok=True)
     
-    viz = WallVisualizer(output_dir=output_dir)
+    viz = _viz(output_dir)
     
     print("\n1. Testing Score Visualization...")
     try:
@@ -42,6 +52,7 @@ def test_visualization():
     
     print("\n2. Testing Context Boundary Visualization...")
     try:
+        from wall_library.nlp import ContextManager
         context_manager = ContextManager()
         context_manager.add_keywords(["healthcare", "medical", "doctor", "patient"])
         context_manager.add_string_list([
@@ -110,12 +121,11 @@ def test_visualization():
     print("\n5. Testing 3D Embeddings Visualization (IMPORTANT)...")
     try:
         # Generate sample embeddings (3D for simplicity)
-        import numpy as np
         np.random.seed(42)
-        embeddings = np.random.rand(20, 3).tolist()
+        # uint8-quantized embeddings; dequantized with scale=1/255 when plotted
+        embeddings = np.random.randint(0, 256, (20, 3), dtype=np.uint8)
         
-        # Create detailed labels with text, keywords, etc.
-        labels = []
+        # Detailed labels with text, keywords, etc. (generated lazily below)
         sample_texts = [
             "Common symptoms of diabetes include increased thirst and frequent urination.",
             "Blood pressure medications should be taken as prescribed by your doctor.",
@@ -162,15 +172,17 @@ def test_visualization():
             ["healthcare", "communication", "guidelines"]
         ]
         
-        for i in range(20):
-            labels.append({
+        labels = (
+            {
                 "label": f"Response {i+1}",
                 "text": sample_texts[i],
                 "keywords": sample_keywords[i],
                 "metadata": {"domain": "healthcare", "index": i}
-            })
+            }
+            for i in range(20)
+        )
         
-        path = viz.visualize_3d_embeddings(embeddings, labels, title="3D Embedding Space")
+        path = viz.visualize_3d_embeddings(embeddings, labels, title="3D Embedding Space", scale=1 / 255)
         if path:
             print(f"   ✅ 3D embeddings visualization saved to: {path}")
         else:
@@ -180,60 +192,50 @@ def test_visualization():
     
     print("\n6. Testing 3D Scores Visualization (IMPORTANT)...")
     try:
-        scores_data = [
-            {
-                "CosineSimilarity": 0.85,
-                "ROUGEMetric": 0.72,
-                "BLEUMetric": 0.68,
-                "label": "Diabetes Symptoms Response",
-                "text": "Common symptoms of diabetes include increased thirst, frequent urination, unexplained weight loss, fatigue, and blurred vision. Consult a healthcare provider for proper diagnosis.",
-                "keywords": ["diabetes", "symptoms", "thirst", "urination", "fatigue"],
-                "metadata": {"domain": "healthcare", "topic": "diabetes"}
-            },
-            {
-                "CosineSimilarity": 0.78,
-                "ROUGEMetric": 0.65,
-                "BLEUMetric": 0.61,
-                "label": "Blood Pressure Medication",
-                "text": "Blood pressure medications should be taken exactly as prescribed by your doctor, usually at the same time each day. Never stop taking medication without consulting your healthcare provider.",
-                "keywords": ["blood pressure", "medication", "doctor", "prescribed"],
-                "metadata": {"domain": "healthcare", "topic": "medication"}
-            },
-            {
-                "CosineSimilarity": 0.92,
-                "ROUGEMetric": 0.88,
-                "BLEUMetric": 0.85,
-                "label": "Preventive Screenings",
-                "text": "Preventive screenings vary by age and risk factors but typically include blood pressure checks, cholesterol tests, cancer screenings, and diabetes screening. Consult your doctor for personalized recommendations.",
-                "keywords": ["preventive", "screening", "blood pressure", "cholesterol", "cancer"],
-                "metadata": {"domain": "healthcare", "topic": "prevention"}
-            },
-            {
-                "CosineSimilarity": 0.65,
-                "ROUGEMetric": 0.55,
-                "BLEUMetric": 0.52,
-                "label": "Mental Health Support",
-                "text": "Mental health can be improved through therapy, medication when needed, regular exercise, adequate sleep, stress management, and social support. Professional help is available.",
-                "keywords": ["mental health", "therapy", "medication", "exercise", "support"],
-                "metadata": {"domain": "healthcare", "topic": "mental health"}
-            },
-            {
-                "CosineSimilarity": 0.88,
-                "ROUGEMetric": 0.75,
-                "BLEUMetric": 0.71,
-                "label": "Vaccination Schedule",
-                "text": "Vaccination schedules vary by age and health status. Follow CDC guidelines and consult your healthcare provider for personalized vaccination recommendations.",
-                "keywords": ["vaccination", "schedule", "CDC", "healthcare provider", "age"],
-                "metadata": {"domain": "healthcare", "topic": "vaccination"}
-            }
-        ]
+        # Score columns (one array per metric) with parallel per-row metadata
+        scores_data = {
+            "CosineSimilarity": np.array([0.85, 0.78, 0.92, 0.65, 0.88], dtype=np.float32),
+            "ROUGEMetric": np.array([0.72, 0.65, 0.88, 0.55, 0.75], dtype=np.float32),
+            "BLEUMetric": np.array([0.68, 0.61, 0.85, 0.52, 0.71], dtype=np.float32),
+        }
+        meta = {
+            "label": [
+                "Diabetes Symptoms Response",
+                "Blood Pressure Medication",
+                "Preventive Screenings",
+                "Mental Health Support",
+                "Vaccination Schedule",
+            ],
+            "text": [
+                "Common symptoms of diabetes include increased thirst, frequent urination, unexplained weight loss, fatigue, and blurred vision. Consult a healthcare provider for proper diagnosis.",
+                "Blood pressure medications should be taken exactly as prescribed by your doctor, usually at the same time each day. Never stop taking medication without consulting your healthcare provider.",
+                "Preventive screenings vary by age and risk factors but typically include blood pressure checks, cholesterol tests, cancer screenings, and diabetes screening. Consult your doctor for personalized recommendations.",
+                "Mental health can be improved through therapy, medication when needed, regular exercise, adequate sleep, stress management, and social support. Professional help is available.",
+                "Vaccination schedules vary by age and health status. Follow CDC guidelines and consult your healthcare provider for personalized vaccination recommendations.",
+            ],
+            "keywords": [
+                ["diabetes", "symptoms", "thirst", "urination", "fatigue"],
+                ["blood pressure", "medication", "doctor", "prescribed"],
+                ["preventive", "screening", "blood pressure", "cholesterol", "cancer"],
+                ["mental health", "therapy", "medication", "exercise", "support"],
+                ["vaccination", "schedule", "CDC", "healthcare provider", "age"],
+            ],
+            "metadata": [
+                {"domain": "healthcare", "topic": "diabetes"},
+                {"domain": "healthcare", "topic": "medication"},
+                {"domain": "healthcare", "topic": "prevention"},
+                {"domain": "healthcare", "topic": "mental health"},
+                {"domain": "healthcare", "topic": "vaccination"},
+            ],
+        }
         
         path = viz.visualize_3d_scores(
             scores_data,
             x_metric="CosineSimilarity",
             y_metric="ROUGEMetric",
             z_metric="BLEUMetric",
-            title="3D Score Space Visualization"
+            title="3D Score Space Visualization",
+            meta=meta
         )
         if path:
             print(f"   ✅ 3D scores visualization saved to: {path}")
@@ -244,16 +246,14 @@ def test_visualization():
     
     print("\n7. Testing Validation Results Visualization...")
     try:
-        validation_results = [
-            {"passed": True, "timestamp": i, "validator": "SafetyValidator"}
-            for i in range(10)
-        ] + [
-            {"passed": False, "timestamp": i, "validator": "LengthValidator"}
-            for i in range(10, 15)
-        ] + [
-            {"passed": True, "timestamp": i, "validator": "SafetyValidator"}
-            for i in range(15, 25)
-        ]
+        validation_results = np.empty(
+            25, dtype=[("passed", "?"), ("timestamp", "i4"), ("validator", "U16")]
+        )
+        validation_results["timestamp"] = np.arange(25)
+        validation_results["passed"] = True
+        validation_results["passed"][10:15] = False
+        validation_results["validator"] = "SafetyValidator"
+        validation_results["validator"][10:15] = "LengthValidator"
         
         path = viz.visualize_validation_results(validation_results)
         if path:
@@ -287,7 +287,9 @@ def test_visualization():
             "total_interactions": 150,
             "success_rate": 0.92,
             "avg_latency": 0.45,
-            "latencies": [0.3, 0.4, 0.5, 0.6, 0.4, 0.5, 0.45, 0.5, 0.4, 0.5] * 15,
+            "latencies": np.tile(
+                np.array([0.3, 0.4, 0.5, 0.6, 0.4, 0.5, 0.45, 0.5, 0.4, 0.5], dtype=np.float32), 15
+            ),
             "errors": {
                 "ValidationError": 5,
                 "TimeoutError": 3,
@@ -1,67 +1,43 @@
 """Tests for async functionality."""
 
-import time
 import asyncio
-from examples.tests.test_utils import TestResult
+from examples.tests.test_utils import report, timed_test, get_async_guard
 from wall_library.async_guard import AsyncGuard
 
 
+@timed_test("Async Guard Creation", "Guard created")
 def test_async_guard_creation():
     """Test async guard creation."""
-    start = time.time()
-    try:
-        guard = AsyncGuard()
-        assert guard is not None
-        elapsed = time.time() - start
-        return TestResult("Async Guard Creation", True, f"Guard created in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Async Guard Creation", False, str(e), e, elapsed)
+    guard = AsyncGuard()
+    assert guard is not None
 
 
+@timed_test("Async Validation", "Validation completed")
 async def async_test_validation():
     """Test async validation."""
-    start = time.time()
-    try:
-        guard = AsyncGuard()
-        # Use async_validate instead of validate
-        outcome = await guard.async_validate("test")
-        assert outcome is not None
-        elapsed = time.time() - start
-        return TestResult("Async Validation", True, f"Validation completed in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Async Validation", False, str(e), e, elapsed)
+    guard = get_async_guard()
+    # Use async_validate instead of validate
+    outcome = await guard.async_validate("test")
+    assert outcome is not None
 
 
-def test_async_validation():
-    """Wrapper for async validation test."""
-    return asyncio.run(async_test_validation())
-
-
-def run_tests() -> list:
-    """Run all async tests."""
-    print("\n" + "=" * 60)
-    print("Async Tests")
-    print("=" * 60)
-    
+async def run_tests_async() -> list:
+    """Run all async tests concurrently on one event loop."""
     tests = [
         test_async_guard_creation,
-        test_async_validation,
+        async_test_validation,
     ]
     
-    results = []
-    for test in tests:
-        result = test()
-        results.append(result)
-        status = "✓" if result.passed else "✗"
-        print(f"{status} {result.name}: {result.message}")
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    print(f"\nResults: {passed}/{total} passed")
-    
-    return results
+    # Coroutine tests are awaited directly; sync tests run in worker threads
+    return await asyncio.gather(*(
+        test() if asyncio.iscoroutinefunction(test) else asyncio.to_thread(test)
+        for test in tests
+    ))
+
+
+def run_tests() -> list:
+    """Run all async tests."""
+    return report("Async Tests", asyncio.run(run_tests_async()))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 """Tests for core Guard functionality."""
 
-import time
-from examples.tests.test_utils import TestResult, TestData
+from examples.tests.test_utils import run_and_report, timed_test, TestData
 from wall_library import WallGuard, OnFailAction
 from wall_library.validator_base import Validator, register_validator
 from wall_library.classes.validation.validation_result import PassResult, FailResult
@@ -38,112 +37,101 @@ class LengthValidator(Validator):
         return PassResult(metadata=metadata)
 
 
+@timed_test("Guard Creation", "Guard created")
 def test_guard_creation():
     """Test guard creation."""
-    start = time.time()
-    try:
-        guard = WallGuard()
-        assert guard is not None
-        assert guard.validators == []
-        assert guard.validator_map == {}
-        elapsed = time.time() - start
-        return TestResult("Guard Creation", True, f"Guard created in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Guard Creation", False, str(e), e, elapsed)
+    guard = WallGuard()
+    assert guard is not None
+    assert guard.validators == []
+    assert guard.validator_map == {}
 
 
+@timed_test("Guard with Validator", "Guard configured with validator")
 def test_guard_with_validator():
     """Test guard with validator."""
-    start = time.time()
-    try:
-        guard = WallGuard().use(
-            (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION)
-        )
-        assert len(guard.validators) == 1
-        assert "output" in guard.validator_map
-        elapsed = time.time() - start
-        return TestResult("Guard with Validator", True, f"Guard configured with validator in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Guard with Validator", False, str(e), e, elapsed)
+    guard = WallGuard().use(
+        (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION)
+    )
+    assert len(guard.validators) == 1
+    assert "output" in guard.validator_map
 
 
+@timed_test("Guard Validation", "Validation passed")
 def test_guard_validation():
     """Test guard validation."""
-    start = time.time()
-    try:
-        guard = WallGuard().use(
-            (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION)
-        )
-        outcome = guard.validate("Hello World")
-        assert outcome.validation_passed == True
-        assert outcome.validated_output == "Hello World"
-        elapsed = time.time() - start
-        return TestResult("Guard Validation", True, f"Validation passed in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Guard Validation", False, str(e), e, elapsed)
+    guard = WallGuard().use(
+        (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION)
+    )
+    outcome = guard.validate("Hello World")
+    assert outcome.validation_passed == True
+    assert outcome.validated_output == "Hello World"
 
 
+@timed_test("Multiple Validators", "Guard with multiple validators")
 def test_multiple_validators():
     """Test multiple validators."""
-    start = time.time()
-    try:
-        guard = WallGuard().use(
-            (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION)
-        ).use(
-            (LengthValidator, {"min_length": 10, "max_length": 15, "require_rc": False}, OnFailAction.FILTER)
-        )
-        assert len(guard.validators) == 2
-        elapsed = time.time() - start
-        return TestResult("Multiple Validators", True, f"Guard with multiple validators in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Multiple Validators", False, str(e), e, elapsed)
-
-
+    guard = WallGuard().use_many(
+        (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION),
+        (LengthValidator, {"min_length": 10, "max_length": 15, "require_rc": False}, OnFailAction.FILTER),
+    )
+    assert len(guard.validators) == 2
+    outcome = guard.validate("Hello World!", parallel=True)
+    assert outcome.validation_passed == True
+    outcome = guard.validate("Hi", parallel=True)
+    assert outcome.validation_passed == False
+    assert len(outcome.metadata["validation_results"]) == 2
+
+
+@timed_test("Guard Configuration", "Guard configured")
 def test_guard_configure():
     """Test guard configuration."""
-    start = time.time()
-    try:
-        guard = WallGuard()
-        guard.configure(num_reasks=3)
-        assert guard.num_reasks == 3
-        assert guard.exec_options.num_reasks == 3
-        elapsed = time.time() - start
-        return TestResult("Guard Configuration", True, f"Guard configured in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Guard Configuration", False, str(e), e, elapsed)
+    guard = WallGuard()
+    guard.configure(num_reasks=3, cache=True)
+    assert guard.num_reasks == 3
+    assert guard.exec_options.num_reasks == 3
+    assert guard.exec_options.cache == True
+
+
+@timed_test("Validation Cache", "Cached results reused")
+def test_validation_cache():
+    """Test repeated validation of the same output reuses cached results."""
+    guard = WallGuard().use(
+        (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.FILTER)
+    ).configure(cache=True)
+    first = guard.validate("Hello World")
+    second = guard.validate("Hello World")
+    assert second.validation_passed == True
+    assert second.metadata["validation_results"][0] is first.metadata["validation_results"][0]
+    
+    guard.clear_validation_cache()
+    third = guard.validate("Hello World")
+    assert third.metadata["validation_results"][0] is not first.metadata["validation_results"][0]
+
+
+@timed_test("Guard Reset", "Guard reset")
+def test_guard_reset():
+    """Test resetting a configured guard for reuse."""
+    guard = WallGuard().use(
+        (LengthValidator, {"min_length": 5, "max_length": 20, "require_rc": False}, OnFailAction.EXCEPTION)
+    ).configure(num_reasks=2)
+    assert guard.reset() is guard
+    assert guard.validators == []
+    assert guard.validator_map == {}
+    assert guard.exec_options.num_reasks == 0
+    assert guard.validate("Hi").validation_passed == True
 
 
 def run_tests() -> list:
     """Run all core guard tests."""
-    print("\n" + "=" * 60)
-    print("Core Guard Tests")
-    print("=" * 60)
-    
-    tests = [
+    return run_and_report("Core Guard Tests", (
         test_guard_creation,
         test_guard_with_validator,
         test_guard_validation,
         test_multiple_validators,
         test_guard_configure,
-    ]
-    
-    results = []
-    for test in tests:
-        result = test()
-        results.append(result)
-        status = "✓" if result.passed else "✗"
-        print(f"{status} {result.name}: {result.message}")
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    print(f"\nResults: {passed}/{total} passed")
-    
-    return results
+        test_validation_cache,
+        test_guard_reset,
+    ))
 
 
 if __name__ == "__main__":
@@ -1,52 +1,43 @@
 """Tests for NLP context filtering."""
 
-import time
-from examples.tests.test_utils import TestResult, TestData, create_temp_document_file, cleanup_temp_file
+from examples.tests.test_utils import (
+    run_and_report,
+    timed_test,
+    TestData,
+    create_temp_document_file,
+    cleanup_temp_file,
+    get_context_manager,
+)
 from wall_library.nlp import ContextManager
+from wall_library.nlp.prompts import CONTEXT_VALIDATION_COT_PROMPT
+import numpy as np
 
 
+@timed_test("Keyword Matching", "Keywords matched")
 def test_keyword_matching():
     """Test keyword matching."""
-    start = time.time()
-    try:
-        context_manager = ContextManager()
-        keywords = TestData.sample_keywords()
-        context_manager.add_keywords(keywords)
-        
-        text = "Python is a great programming language"
-        is_valid = context_manager.check_context(text)
-        assert is_valid == True  # Should match "Python" and "programming"
-        elapsed = time.time() - start
-        return TestResult("Keyword Matching", True, f"Keywords matched in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Keyword Matching", False, str(e), e, elapsed)
+    context_manager = get_context_manager(TestData.sample_keywords())
+
+    text = "Python is a great programming language"
+    is_valid = context_manager.check_context(text)
+    assert is_valid == True  # Should match "Python" and "programming"
 
 
+@timed_test("String List Matching", "String list matched")
 def test_string_list_matching():
     """Test string list matching."""
-    start = time.time()
-    try:
-        context_manager = ContextManager()
-        documents = TestData.sample_documents()
-        context_manager.add_string_list(documents)
-        
-        text = "Python is used for web development"
-        is_valid = context_manager.check_context(text, threshold=0.5)
-        assert is_valid == True
-        elapsed = time.time() - start
-        return TestResult("String List Matching", True, f"String list matched in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("String List Matching", False, str(e), e, elapsed)
+    context_manager = get_context_manager(contexts=TestData.sample_documents())
 
+    text = "Python is used for web development"
+    is_valid = context_manager.check_context(text, threshold=0.5)
+    assert is_valid == True
 
+
+@timed_test("File-based Context", "File loaded")
 def test_file_based_context():
     """Test file-based context loading."""
-    start = time.time()
-    doc_file = None
+    doc_file = create_temp_document_file()
     try:
-        doc_file = create_temp_document_file()
         context_manager = ContextManager()
         context_manager.load_from_file(doc_file)
         
@@ -54,90 +45,156 @@ def test_file_based_context():
         text = "Python programming"
         is_valid = context_manager.check_context(text)
         assert is_valid == True
-        elapsed = time.time() - start
+    finally:
         cleanup_temp_file(doc_file)
-        return TestResult("File-based Context", True, f"File loaded in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        if doc_file:
-            cleanup_temp_file(doc_file)
-        return TestResult("File-based Context", False, str(e), e, elapsed)
 
 
+@timed_test("Cosine Similarity", "Similarity calculated")
 def test_cosine_similarity():
     """Test cosine similarity filtering."""
-    start = time.time()
-    try:
-        context_manager = ContextManager()
-        documents = TestData.sample_documents()
-        context_manager.add_string_list(documents)
-        
-        # Test with similar text
-        similar_text = "Python is a versatile programming language for web development"
-        is_valid = context_manager.check_context(similar_text, threshold=0.7)
-        assert is_valid == True
-        
-        # Test with different text
-        different_text = "Cooking recipes and food preparation techniques"
-        is_valid = context_manager.check_context(different_text, threshold=0.7)
-        # Should fail or pass depending on threshold
-        elapsed = time.time() - start
-        return TestResult("Cosine Similarity", True, f"Similarity calculated in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Cosine Similarity", False, str(e), e, elapsed)
+    context_manager = get_context_manager(contexts=TestData.sample_documents())
+
+    # Test with similar text
+    similar_text = "Python is a versatile programming language for web development"
+    is_valid = context_manager.check_context(similar_text, threshold=0.7)
+    assert is_valid == True
 
+    # Test with different text
+    different_text = "Cooking recipes and food preparation techniques"
+    is_valid = context_manager.check_context(different_text, threshold=0.7)
+    # Should fail or pass depending on threshold
 
+
+@timed_test("Context Boundary", "Boundary checked")
 def test_context_boundary():
     """Test context boundary enforcement."""
-    start = time.time()
-    try:
-        context_manager = ContextManager()
-        keywords = ["Python", "programming"]
-        context_manager.add_keywords(keywords)
-        
-        # Valid text
-        valid_text = "Python programming is fun"
-        assert context_manager.check_context(valid_text) == True
-        
-        # Invalid text (should still pass if no strict boundary)
-        invalid_text = "Cooking is fun"
-        # May pass or fail depending on implementation
-        result = context_manager.check_context(invalid_text)
-        assert isinstance(result, bool)
-        elapsed = time.time() - start
-        return TestResult("Context Boundary", True, f"Boundary checked in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Context Boundary", False, str(e), e, elapsed)
+    context_manager = get_context_manager(frozenset({"Python", "programming"}))
+
+    # Valid text
+    valid_text = "Python programming is fun"
+    assert context_manager.check_context(valid_text) == True
+
+    # Invalid text (should still pass if no strict boundary)
+    invalid_text = "Cooking is fun"
+    # May pass or fail depending on implementation
+    result = context_manager.check_context(invalid_text)
+    assert isinstance(result, bool)
+
+
+@timed_test("Check Context Cache", "Cache invalidated")
+def test_check_context_cache():
+    """Test memoized context checks are invalidated when the corpus changes."""
+    context_manager = ContextManager()
+    context_manager.add_string_list(TestData.sample_documents())
+
+    text = "Baking bread at home"
+    assert context_manager.check_context(text, threshold=0.5) == False
+    assert context_manager.check_context(text, threshold=0.5) == False
+
+    # New context must not be shadowed by the cached negative result
+    context_manager.add_string_list(["Baking bread at home is relaxing"])
+    assert context_manager.check_context(text, threshold=0.5) == True
+
+
+@timed_test("Direct Corpus Edits", "Edited corpus re-scored")
+def test_direct_corpus_edits():
+    """Test cached scores follow edits made directly to contexts and keywords."""
+    context_manager = ContextManager()
+    context_manager.add_string_list(["Python programming language syntax"])
+    assert context_manager.check_context("Python syntax rules", threshold=0.3) == True
+
+    # Same number of contexts, different content
+    context_manager.contexts[0] = "Chocolate cookie baking recipes"
+    assert context_manager.check_context("Python syntax rules", threshold=0.3) == False
+    assert context_manager.check_context("Chocolate cookie recipes", threshold=0.3) == True
+
+    # Same number of keywords, different content
+    context_manager.keywords = {"alpha"}
+    assert context_manager.check_context("alpha release notes") == True
+    context_manager.keywords = {"gamma"}
+    assert context_manager.check_context("alpha release notes") == False
+
+
+@timed_test("LLM Check Cache", "LLM verdict reused")
+def test_llm_check_cache():
+    """Test repeated llm_check queries reuse the cached LLM verdict when enabled."""
+    context_manager = ContextManager(verdict_cache=True)
+    context_manager.add_string_list(TestData.sample_documents())
+
+    prompts = []
+    def llm_call(prompt):
+        prompts.append(prompt)
+        return "final_answer: yes"
+
+    assert context_manager.check_context("Is Python good for ML?", strategy="llm_check", llm_call=llm_call) == True
+    assert context_manager.check_context("is python good for ml", strategy="llm_check", llm_call=llm_call) == True
+    assert len(prompts) == 1
+    # The cached prefix plus the per-query suffix is the full CoT prompt
+    context_str, keywords_str = context_manager._llm_prompt_fields()
+    assert prompts[0] == CONTEXT_VALIDATION_COT_PROMPT.format(
+        context=context_str, keywords=keywords_str, text="Is Python good for ML?"
+    )
+
+    # Changing the corpus invalidates cached verdicts
+    context_manager.add_string_list(["Python is widely used in data science"])
+    context_manager.check_context("Is Python good for ML?", strategy="llm_check", llm_call=llm_call)
+    assert len(prompts) == 2
+
+
+class _ConstantEmbeddingModel:
+    """Stand-in encoder that maps every text to the same unit vector."""
+
+    def encode(self, texts, normalize_embeddings=True):
+        if isinstance(texts, str):
+            return np.array([1.0, 0.0], dtype=np.float32)
+        return np.tile(np.array([1.0, 0.0], dtype=np.float32), (len(texts), 1))
+
+
+@timed_test("LLM Verdict Cache Opt-in", "Negated query re-checked")
+def test_llm_verdict_cache_opt_in():
+    """Test verdicts are not reused by default or for negated near-duplicates."""
+    def llm_call(prompt):
+        prompts.append(prompt)
+        return "final_answer: no" if "not allowed" in prompt else "final_answer: yes"
+
+    # Off by default: every llm_check asks the LLM
+    prompts = []
+    context_manager = ContextManager(contexts=list(TestData.sample_documents()))
+    assert context_manager.check_context("Is Python allowed?", strategy="llm_check", llm_call=llm_call) == True
+    assert context_manager.check_context("Is Python allowed?", strategy="llm_check", llm_call=llm_call) == True
+    assert len(prompts) == 2
+
+    # Exact tier only: a negated near-duplicate gets its own verdict even when
+    # the embedding model considers the two queries identical
+    prompts = []
+    context_manager = ContextManager(contexts=list(TestData.sample_documents()), verdict_cache=True)
+    context_manager.similarity_engine.model = _ConstantEmbeddingModel()
+    context_manager.similarity_engine.use_semantic = True
+    assert context_manager.check_context("Is Python allowed?", strategy="llm_check", llm_call=llm_call) == True
+    assert context_manager.check_context("Is Python not allowed?", strategy="llm_check", llm_call=llm_call) == False
+    assert len(prompts) == 2
+
+    # The semantic tier is a separate opt-in
+    context_manager.verdict_cache_similarity = 0.99
+    context_manager.add_string_list(["Python is widely used in data science"])
+    assert context_manager.check_context("Is Python allowed?", strategy="llm_check", llm_call=llm_call) == True
+    assert context_manager.check_context("Is Python usable?", strategy="llm_check", llm_call=llm_call) == True
+    assert len(prompts) == 3
 
 
 def run_tests() -> list:
     """Run all NLP context tests."""
-    print("\n" + "=" * 60)
-    print("NLP Context Filtering Tests")
-    print("=" * 60)
-    
-    tests = [
+    return run_and_report("NLP Context Filtering Tests", (
         test_keyword_matching,
         test_string_list_matching,
         test_file_based_context,
         test_cosine_similarity,
         test_context_boundary,
-    ]
-    
-    results = []
-    for test in tests:
-        result = test()
-        results.append(result)
-        status = "✓" if result.passed else "✗"
-        print(f"{status} {result.name}: {result.message}")
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    print(f"\nResults: {passed}/{total} passed")
-    
-    return results
+        test_check_context_cache,
+        test_direct_corpus_edits,
+        test_llm_check_cache,
+        test_llm_verdict_cache_opt_in,
+    ))
 
 
 if __name__ == "__main__":
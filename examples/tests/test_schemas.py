@@ -1,101 +1,124 @@
 """Tests for schema functionality."""
 
-import time
-from examples.tests.test_utils import TestResult, TestData, create_temp_rail_file, cleanup_temp_file
+import json
+import math
+from examples.tests.test_utils import run_and_report, timed_test, TestData, create_temp_rail_file, cleanup_temp_file, check_optional_dependency
+from wall_library.formatters import JSONFormatter
 from wall_library.schema.pydantic_schema import pydantic_model_to_schema
 from wall_library.schema.rail_schema import rail_string_to_schema, rail_file_to_schema
+from wall_library.validator_base import Validator, register_validator
+from wall_library.classes.validation.validation_result import PassResult
 from wall_library.schema.generator import generate_json_schema
 
 
+@timed_test("Pydantic to Schema", "Schema generated")
 def test_pydantic_to_schema():
     """Test Pydantic model to schema conversion."""
-    start = time.time()
-    try:
-        Person = TestData.sample_pydantic_model()
-        schema = pydantic_model_to_schema(Person)
-        assert schema is not None
-        assert "properties" in schema or "type" in schema
-        elapsed = time.time() - start
-        return TestResult("Pydantic to Schema", True, f"Schema generated in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Pydantic to Schema", False, str(e), e, elapsed)
+    Person = TestData.sample_pydantic_model()
+    schema = pydantic_model_to_schema(Person)
+    assert schema is not None
+    assert "properties" in schema or "type" in schema
 
 
+@timed_test("RAIL String Parsing", "RAIL parsed")
 def test_rail_string_parsing():
     """Test RAIL string parsing."""
-    start = time.time()
-    try:
-        rail_string = TestData.sample_rail_string()
-        schema = rail_string_to_schema(rail_string)
-        assert schema is not None
-        assert schema.schema is not None
-        elapsed = time.time() - start
-        return TestResult("RAIL String Parsing", True, f"RAIL parsed in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("RAIL String Parsing", False, str(e), e, elapsed)
+    rail_string = TestData.sample_rail_string()
+    schema = rail_string_to_schema(rail_string)
+    assert schema is not None
+    assert schema.schema is not None
+
+
+@timed_test("RAIL Late Validator Registration", "Validators resolved per parse")
+def test_rail_late_validator_registration():
+    """Test that a cached RAIL parse picks up validators registered afterwards."""
+    rail_string = (
+        '<rail version="0.1"><output type="string" validators="test_late_alias" '
+        'on-fail-test_late_alias="exception"/></rail>'
+    )
+    assert rail_string_to_schema(rail_string).validators == []
+
+    class LateValidator(Validator):
+        def __init__(self, **kwargs):
+            super().__init__(require_rc=False, **kwargs)
+
+        def _validate(self, value, metadata):
+            return PassResult(metadata=metadata)
 
+    register_validator("test_late_alias")(LateValidator)
+    schema = rail_string_to_schema(rail_string)
+    assert [type(v) for v in schema.validator_map["output"]] == [LateValidator]
+    assert schema.validators[0].on_fail == "exception"
 
+    class ReplacementValidator(LateValidator):
+        pass
+
+    register_validator("test_late_alias")(ReplacementValidator)
+    schema = rail_string_to_schema(rail_string)
+    assert [type(v) for v in schema.validator_map["output"]] == [ReplacementValidator]
+
+
+@timed_test("RAIL File Parsing", "RAIL file parsed")
 def test_rail_file_parsing():
     """Test RAIL file parsing."""
-    start = time.time()
-    rail_file = None
+    rail_file = create_temp_rail_file()
     try:
-        rail_file = create_temp_rail_file()
         schema = rail_file_to_schema(rail_file)
         assert schema is not None
         assert schema.schema is not None
-        elapsed = time.time() - start
+    finally:
         cleanup_temp_file(rail_file)
-        return TestResult("RAIL File Parsing", True, f"RAIL file parsed in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        if rail_file:
-            cleanup_temp_file(rail_file)
-        return TestResult("RAIL File Parsing", False, str(e), e, elapsed)
 
 
+@timed_test("JSON Schema Generation", "JSON schema generated")
 def test_json_schema_generation():
     """Test JSON schema generation."""
-    start = time.time()
-    try:
-        rail_string = TestData.sample_rail_string()
-        processed_schema = rail_string_to_schema(rail_string)
-        json_schema = generate_json_schema(processed_schema)
-        assert json_schema is not None
-        elapsed = time.time() - start
-        return TestResult("JSON Schema Generation", True, f"JSON schema generated in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("JSON Schema Generation", False, str(e), e, elapsed)
+    rail_string = TestData.sample_rail_string()
+    processed_schema = rail_string_to_schema(rail_string)
+    json_schema = generate_json_schema(processed_schema)
+    assert json_schema is not None
+
+
+@timed_test("JSON Formatter Parity", "orjson and stdlib outputs agree")
+def test_json_formatter_parity():
+    """Test that the opt-in orjson encoder agrees with the default stdlib one."""
+    if not check_optional_dependency("orjson"):
+        return "Skipped - orjson not available"
+
+    stdlib, fast = JSONFormatter(), JSONFormatter(use_orjson=True)
+    payload = {
+        "name": "Zoë ☕",
+        "scores": [0.807, 1e20, 1e-7],
+        "nested": {"empty": [], "flags": {"ok": True}},
+        1: "int key",
+    }
+    fast_text, stdlib_text = fast.format(payload), stdlib.format(payload)
+    assert json.loads(fast_text) == json.loads(stdlib_text)
+    indents = [[len(line) - len(line.lstrip()) for line in text.splitlines()] for text in (fast_text, stdlib_text)]
+    assert indents[0] == indents[1]
+    # Only the documented spellings differ
+    assert "Zoë ☕" in fast_text and "\\u00eb" in stdlib_text
+    assert "1e20" in fast_text and "1e+20" in stdlib_text
+
+    ascii_payload = {"name": "plain", "values": [1, 2.5], "nested": {"a": []}}
+    assert fast.format(ascii_payload) == stdlib.format(ascii_payload)
+
+    # Non-finite floats keep their values on both paths
+    special = {"values": [math.nan, math.inf, -math.inf, None]}
+    assert fast.format(special) == stdlib.format(special)
+    assert "NaN" in fast.format(special)
 
 
 def run_tests() -> list:
     """Run all schema tests."""
-    print("\n" + "=" * 60)
-    print("Schema Tests")
-    print("=" * 60)
-    
-    tests = [
+    return run_and_report("Schema Tests", (
         test_pydantic_to_schema,
         test_rail_string_parsing,
+        test_rail_late_validator_registration,
         test_rail_file_parsing,
         test_json_schema_generation,
-    ]
-    
-    results = []
-    for test in tests:
-        result = test()
-        results.append(result)
-        status = "✓" if result.passed else "✗"
-        print(f"{status} {result.name}: {result.message}")
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    print(f"\nResults: {passed}/{total} passed")
-    
-    return results
+        test_json_formatter_parity,
+    ))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """Tests for scoring metrics."""
 
-import time
-from examples.tests.test_utils import TestResult, check_optional_dependency
+import asyncio
+from examples.tests.test_utils import run_and_report, timed_test, check_optional_dependency
 from wall_library.scoring import ResponseScorer
 from wall_library.scoring.metrics import (
     CosineSimilarityMetric,
@@ -11,131 +11,113 @@ from wall_library.scoring.metrics import (
 )
 
 
+@timed_test("Cosine Similarity", "Score: {score:.3f}")
 def test_cosine_similarity():
     """Test cosine similarity metric."""
-    start = time.time()
-    try:
-        metric = CosineSimilarityMetric()
-        response = "This is a test response"
-        expected = "This is a test response"
-        score = metric.compute(response, expected)
-        assert 0.0 <= score <= 1.0
-        assert score > 0.9  # Should be high for identical strings
-        elapsed = time.time() - start
-        return TestResult("Cosine Similarity", True, f"Score: {score:.3f} in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Cosine Similarity", False, str(e), e, elapsed)
+    metric = CosineSimilarityMetric()
+    response = "This is a test response"
+    expected = "This is a test response"
+    score = metric.compute(response, expected)
+    assert 0.0 <= score <= 1.0
+    assert score > 0.9  # Should be high for identical strings
+    return {"score": score}
 
 
+@timed_test("Semantic Similarity", "Score: {score:.3f}")
 def test_semantic_similarity():
     """Test semantic similarity metric."""
-    start = time.time()
-    try:
-        metric = SemanticSimilarityMetric()
-        response = "The cat sat on the mat"
-        expected = "A cat was sitting on a mat"
-        score = metric.compute(response, expected)
-        assert 0.0 <= score <= 1.0
-        elapsed = time.time() - start
-        return TestResult("Semantic Similarity", True, f"Score: {score:.3f} in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Semantic Similarity", False, str(e), e, elapsed)
+    metric = SemanticSimilarityMetric()
+    response = "The cat sat on the mat"
+    expected = "A cat was sitting on a mat"
+    score = metric.compute(response, expected)
+    assert 0.0 <= score <= 1.0
+    return {"score": score}
 
 
+@timed_test("ROUGE Score", "Score: {score:.3f}")
 def test_rouge_score():
     """Test ROUGE score metric."""
-    start = time.time()
     if not check_optional_dependency("rouge_score"):
-        elapsed = time.time() - start
-        return TestResult("ROUGE Score", None, "Skipped - rouge_score not available", None, elapsed)
-    
-    try:
-        metric = ROUGEMetric()
-        response = "The cat sat on the mat"
-        expected = "A cat was sitting on a mat"
-        score = metric.compute(response, expected)
-        assert 0.0 <= score <= 1.0
-        elapsed = time.time() - start
-        return TestResult("ROUGE Score", True, f"Score: {score:.3f} in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("ROUGE Score", False, str(e), e, elapsed)
+        return "Skipped - rouge_score not available"
 
+    metric = ROUGEMetric()
+    response = "The cat sat on the mat"
+    expected = "A cat was sitting on a mat"
+    score = metric.compute(response, expected)
+    assert 0.0 <= score <= 1.0
+    return {"score": score}
 
+
+@timed_test("BLEU Score", "Score: {score:.3f}")
 def test_bleu_score():
     """Test BLEU score metric."""
-    start = time.time()
     if not check_optional_dependency("nltk"):
-        elapsed = time.time() - start
-        return TestResult("BLEU Score", None, "Skipped - nltk not available", None, elapsed)
-    
-    try:
-        metric = BLEUMetric()
-        response = "The cat sat on the mat"
-        expected = "A cat was sitting on a mat"
-        score = metric.compute(response, expected)
-        assert 0.0 <= score <= 1.0
-        elapsed = time.time() - start
-        return TestResult("BLEU Score", True, f"Score: {score:.3f} in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("BLEU Score", False, str(e), e, elapsed)
+        return "Skipped - nltk not available"
+
+    metric = BLEUMetric()
+    response = "The cat sat on the mat"
+    expected = "A cat was sitting on a mat"
+    score = metric.compute(response, expected)
+    assert 0.0 <= score <= 1.0
+    return {"score": score}
 
 
+@timed_test("Response Scorer", "Aggregated score: {aggregated:.3f}")
 def test_response_scorer():
     """Test response scorer aggregation."""
-    start = time.time()
-    try:
-        scorer = ResponseScorer(threshold=0.7)
-        response = "The cat sat on the mat"
-        expected = "A cat was sitting on a mat"
-        scores = scorer.score(response, expected)
-        assert isinstance(scores, dict)
-        assert len(scores) > 0
-        
-        # Test aggregation
-        aggregated = scorer.aggregate_score(scores)
-        assert 0.0 <= aggregated <= 1.0
-        elapsed = time.time() - start
-        return TestResult("Response Scorer", True, f"Aggregated score: {aggregated:.3f} in {elapsed:.3f}s", None, elapsed)
-    except Exception as e:
-        elapsed = time.time() - start
-        return TestResult("Response Scorer", False, str(e), e, elapsed)
+    scorer = ResponseScorer(threshold=0.7)
+    response = "The cat sat on the mat"
+    expected = "A cat was sitting on a mat"
+    scores = scorer.score(response, expected)
+    assert isinstance(scores, dict)
+    assert len(scores) > 0
+
+    # Test aggregation
+    aggregated = scorer.aggregate_score(scores)
+    assert 0.0 <= aggregated <= 1.0
+    return {"aggregated": aggregated}
+
+
+@timed_test("Async Response Scorer", "Scored {count} metrics")
+def test_async_response_scorer():
+    """Test concurrent scoring matches sequential scoring."""
+    scorer = ResponseScorer(threshold=0.7)
+    response = "The cat sat on the mat"
+    expected = "A cat was sitting on a mat"
+    scores = asyncio.run(scorer.async_score(response, expected))
+    assert scores == scorer.score(response, expected)
+    return {"count": len(scores)}
+
+
+@timed_test("Batch Response Scorer", "Scored {count} pairs")
+def test_batch_response_scorer():
+    """Test batch scoring matches per-pair scoring."""
+    scorer = ResponseScorer(threshold=0.7)
+    pairs = [
+        ("The cat sat on the mat", "A cat was sitting on a mat"),
+        ("Python is a language", "Python is a programming language"),
+    ]
+    batch_scores = scorer.score_batch(pairs)
+    assert len(batch_scores) == len(pairs)
+    for scores, (response, expected) in zip(batch_scores, pairs):
+        sequential = scorer.score(response, expected)
+        assert scores.keys() == sequential.keys()
+        for name, score in sequential.items():
+            assert abs(scores[name] - score) < 1e-5
+    return {"count": len(pairs)}
 
 
 def run_tests() -> list:
     """Run all scoring tests."""
-    print("\n" + "=" * 60)
-    print("Scoring Tests")
-    print("=" * 60)
-    
-    tests = [
+    return run_and_report("Scoring Tests", (
         test_cosine_similarity,
         test_semantic_similarity,
         test_rouge_score,
         test_bleu_score,
         test_response_scorer,
-    ]
-    
-    results = []
-    for test in tests:
-        result = test()
-        results.append(result)
-        if result.passed is None:
-            status = "⊘"
-            print(f"{status} {result.name}: {result.message}")
-        else:
-            status = "✓" if result.passed else "✗"
-            print(f"{status} {result.name}: {result.message}")
-    
-    passed = sum(1 for r in results if r.passed == True)
-    total = sum(1 for r in results if r.passed is not None)
-    skipped = sum(1 for r in results if r.passed is None)
-    print(f"\nResults: {passed}/{total} passed, {skipped} skipped")
-    
-    return results
+        test_async_response_scorer,
+        test_batch_response_scorer,
+    ))
 
 
 if __name__ == "__main__":
@@ -3,32 +3,137 @@
 import os
 import tempfile
 import json
+import functools
+import inspect
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Callable, Dict, Any, FrozenSet, NamedTuple, Optional, List, Sequence, Tuple, Union
 from dotenv import load_dotenv
 
+from wall_library import WallGuard
+from wall_library.async_guard import AsyncGuard
+from wall_library.nlp import ContextManager
+from wall_library.scoring import ResponseScorer
+
 # Load environment variables
 load_dotenv()
 
 
-@dataclass
-class TestResult:
-    """Result of a test execution."""
+class TestResult(NamedTuple):
+    """Result of a test execution (passed is None for skipped tests)."""
     name: str
-    passed: bool
+    passed: Optional[bool]
     message: str = ""
     error: Optional[Exception] = None
     execution_time: float = 0.0
 
 
+def timed_test(name: str, message: str = "Passed") -> Callable[[Callable[[], Union[None, str, Dict[str, Any]]]], Callable[[], TestResult]]:
+    """Turn a plain test body into a timed test returning a TestResult.
+
+    The body signals failure by raising. It may return a string to mark the
+    test as skipped with that message, or a dict of values to fill the
+    ``str.format`` fields of ``message`` (e.g. "Score: {score:.3f}").
+    Coroutine bodies produce a coroutine test that resolves to the TestResult.
+
+    Args:
+        name: Test name reported in the result
+        message: Success message; the elapsed time is appended
+    """
+    success_prefix = f"{message} in "
+
+    def result(start: int, returned: Union[None, str, Dict[str, Any]]) -> TestResult:
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        if isinstance(returned, str):
+            return TestResult(name, None, returned, None, elapsed)
+        if returned is not None:
+            return TestResult(name, True, f"{message.format(**returned)} in {elapsed:.3f}s", None, elapsed)
+        return TestResult(name, True, f"{success_prefix}{elapsed:.3f}s", None, elapsed)
+
+    def failure(start: int, e: Exception) -> TestResult:
+        return TestResult(name, False, str(e), e, (time.perf_counter_ns() - start) / 1e9)
+
+    def decorator(func: Callable[[], Union[None, str, Dict[str, Any]]]) -> Callable[[], TestResult]:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper() -> TestResult:
+                start = time.perf_counter_ns()
+                try:
+                    returned = await func()
+                except Exception as e:
+                    return failure(start, e)
+                return result(start, returned)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper() -> TestResult:
+            start = time.perf_counter_ns()
+            try:
+                returned = func()
+            except Exception as e:
+                return failure(start, e)
+            return result(start, returned)
+        return wrapper
+    return decorator
+
+
+_STATUS = {True: "✓", False: "✗", None: "⊘"}
+
+
+def summarize(results: Sequence[TestResult]) -> Tuple[int, int, int]:
+    """Count results in a single pass.
+
+    Returns:
+        (passed, failed, skipped)
+    """
+    counts = Counter(r.passed for r in results)
+    return counts[True], counts[False], counts[None]
+
+
+def report(title: str, results: Sequence[TestResult]) -> List[TestResult]:
+    """Print a section report (title, status lines, summary) in a single write.
+
+    Args:
+        title: Section title printed above the results
+        results: Test results in display order
+
+    Returns:
+        The results as a list
+    """
+    rule = "=" * 60
+    lines = [f"\n{rule}\n{title}\n{rule}\n"]
+    lines.extend(f"{_STATUS[r.passed]} {r.name}: {r.message}\n" for r in results)
+    passed, _, skipped = summarize(results)
+    if skipped:
+        lines.append(f"\nResults: {passed}/{len(results) - skipped} passed, {skipped} skipped\n")
+    else:
+        lines.append(f"\nResults: {passed}/{len(results)} passed\n")
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
+    return list(results)
+
+
+def run_and_report(title: str, tests: Sequence[Callable[[], TestResult]]) -> List[TestResult]:
+    """Run tests on a thread pool and print the report in a single write.
+
+    Args:
+        title: Section title printed above the results
+        tests: Test functions returning TestResult
+
+    Returns:
+        Results in the order of ``tests``
+    """
+    with ThreadPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 4) or 1) as executor:
+        return report(title, list(executor.map(lambda test: test(), tests)))
+
+
 class TestData:
     """Test data generators."""
 
-    @staticmethod
-    def sample_rail_string() -> str:
-        """Generate sample RAIL specification."""
-        return """
+    _SAMPLE_RAIL_STRING = """
         <rail version="0.1">
         <output>
             <string name="name" description="Person's name"/>
@@ -38,67 +143,90 @@ class TestData:
         """
 
     @staticmethod
+    def sample_rail_string() -> str:
+        """Sample RAIL specification."""
+        return TestData._SAMPLE_RAIL_STRING
+
+    @staticmethod
+    @functools.cache
     def sample_pydantic_model():
-        """Generate sample Pydantic model."""
+        """Sample Pydantic model (one class per run, so class-keyed caches hit)."""
         from pydantic import BaseModel, Field
         class Person(BaseModel):
             name: str = Field(description="Person's name")
             age: int = Field(description="Person's age", ge=0, le=150)
         return Person
 
+    _SAMPLE_QUESTIONS: Tuple[str, ...] = (
+        "What is machine learning?",
+        "What is Python?",
+        "What is artificial intelligence?",
+        "How does neural networks work?",
+        "What is deep learning?",
+    )
+    _SAMPLE_ANSWERS: Tuple[str, ...] = (
+        "Machine learning is a subset of AI that enables systems to learn from data.",
+        "Python is a high-level programming language known for its simplicity.",
+        "Artificial intelligence is the simulation of human intelligence by machines.",
+        "Neural networks are computing systems inspired by biological neural networks.",
+        "Deep learning is a subset of ML using neural networks with multiple layers.",
+    )
+
     @staticmethod
     def sample_qa_pairs() -> Dict[str, List[str]]:
-        """Generate sample QA pairs for RAG."""
+        """Sample QA pairs for RAG (fresh lists over shared constants)."""
         return {
-            "questions": [
-                "What is machine learning?",
-                "What is Python?",
-                "What is artificial intelligence?",
-                "How does neural networks work?",
-                "What is deep learning?",
-            ],
-            "answers": [
-                "Machine learning is a subset of AI that enables systems to learn from data.",
-                "Python is a high-level programming language known for its simplicity.",
-                "Artificial intelligence is the simulation of human intelligence by machines.",
-                "Neural networks are computing systems inspired by biological neural networks.",
-                "Deep learning is a subset of ML using neural networks with multiple layers.",
-            ],
+            "questions": list(TestData._SAMPLE_QUESTIONS),
+            "answers": list(TestData._SAMPLE_ANSWERS),
         }
 
+    _SAMPLE_DOCUMENTS: Tuple[str, ...] = (
+        "Python is a versatile programming language used for web development.",
+        "Machine learning involves training models on data to make predictions.",
+        "Artificial intelligence enables machines to perform intelligent tasks.",
+        "Deep learning uses neural networks with multiple hidden layers.",
+        "Natural language processing helps computers understand human language.",
+    )
+    _SAMPLE_KEYWORDS: FrozenSet[str] = frozenset(
+        {"Python", "machine learning", "AI", "programming", "neural networks"}
+    )
+
     @staticmethod
-    def sample_documents() -> List[str]:
-        """Generate sample documents for context filtering."""
-        return [
-            "Python is a versatile programming language used for web development.",
-            "Machine learning involves training models on data to make predictions.",
-            "Artificial intelligence enables machines to perform intelligent tasks.",
-            "Deep learning uses neural networks with multiple hidden layers.",
-            "Natural language processing helps computers understand human language.",
-        ]
+    def sample_documents() -> Tuple[str, ...]:
+        """Sample documents for context filtering (shared, immutable)."""
+        return TestData._SAMPLE_DOCUMENTS
 
     @staticmethod
-    def sample_keywords() -> List[str]:
-        """Generate sample keywords."""
-        return ["Python", "machine learning", "AI", "programming", "neural networks"]
+    def sample_keywords() -> FrozenSet[str]:
+        """Sample keywords (shared, immutable)."""
+        return TestData._SAMPLE_KEYWORDS
+
+    _MOCK_PET_RESPONSE = '{"pet_type": "dog", "name": "Buddy"}'
+    _MOCK_PERSON_RESPONSE = '{"name": "John", "age": 30}'
+    _MOCK_DEFAULT_RESPONSE = "This is a mock response."
 
     @staticmethod
     def mock_llm_response(prompt: str) -> str:
         """Generate mock LLM response."""
         # Simple mock responses based on prompt content
-        if "pet" in prompt.lower():
-            return '{"pet_type": "dog", "name": "Buddy"}'
-        elif "name" in prompt.lower() and "age" in prompt.lower():
-            return '{"name": "John", "age": 30}'
-        else:
-            return "This is a mock response."
+        prompt = prompt.lower()
+        if "pet" in prompt:
+            return TestData._MOCK_PET_RESPONSE
+        if "name" in prompt and "age" in prompt:
+            return TestData._MOCK_PERSON_RESPONSE
+        return TestData._MOCK_DEFAULT_RESPONSE
 
     @staticmethod
     def create_temp_file(content: str, suffix: str = ".txt") -> str:
         """Create a temporary file with content."""
         fd, path = tempfile.mkstemp(suffix=suffix)
-        with os.fdopen(fd, "w") as f:
-            f.write(content)
+        data = memoryview(content.encode("utf-8"))
+        try:
+            # os.write may write fewer bytes than given
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         return path
 
     @staticmethod
@@ -120,8 +248,48 @@ def get_openai_api_key() -> Optional[str]:
     return os.getenv("OPENAI_API_KEY")
 
 
+@functools.cache
+def get_guard() -> WallGuard:
+    """Shared empty WallGuard for tests that only validate through it.
+
+    Tests that call use() or configure() must build their own guard.
+    """
+    return WallGuard()
+
+
+@functools.cache
+def get_async_guard() -> AsyncGuard:
+    """Shared empty AsyncGuard for tests that only validate through it."""
+    return AsyncGuard()
+
+
+@functools.cache
+def get_scorer() -> ResponseScorer:
+    """Shared ResponseScorer with the default metrics, loaded once per run."""
+    return ResponseScorer()
+
+
+@functools.lru_cache(maxsize=None)
+def get_context_manager(
+    keywords: FrozenSet[str] = frozenset(),
+    contexts: Tuple[str, ...] = (),
+) -> ContextManager:
+    """Shared ContextManager preloaded with the given keywords and contexts.
+
+    Tests must not add to the returned manager; tests that change the corpus
+    must build their own.
+    """
+    context_manager = ContextManager()
+    if keywords:
+        context_manager.add_keywords(sorted(keywords))
+    if contexts:
+        context_manager.add_string_list(contexts)
+    return context_manager
+
+
+@functools.cache
 def check_optional_dependency(module_name: str) -> bool:
-    """Check if optional dependency is available."""
+    """Check if optional dependency is available (probed once per module)."""
     try:
         __import__(module_name)
         return True
@@ -138,9 +306,3 @@ def create_temp_document_file() -> str:
     """Create temporary document file."""
     content = "\n".join(TestData.sample_documents())
     return TestData.create_temp_file(content, suffix=".txt")
-
-
-def cleanup_temp_file(path: str):
-    """Clean up temporary file (module-level function)."""
-    TestData.cleanup_temp_file(path)
-
@@ -58,6 +58,8 @@ setup(
         "huggingface": ["transformers>=4.38.0,<5.0.0"],
         "llama-index": ["llama-index>=0.9.0"],
         "databricks": ["mlflow>=2.8.0"],
+        "ahocorasick": ["pyahocorasick>=2.0.0"],
+        "xxhash": ["xxhash>=3.0.0"],
         "all": [
             "openai>=1.30.1,<2.0.0",
             "anthropic>=0.7.2,<1.0.0",
@@ -69,6 +71,8 @@ setup(
             "transformers>=4.38.0,<5.0.0",
             "llama-index>=0.9.0",
             "mlflow>=2.8.0",
+            "pyahocorasick>=2.0.0",
+            "xxhash>=3.0.0",
         ],
         "dev": [
             "pytest>=7.4.3",
@@ -1,17 +1,31 @@
 """Wall Library - Professional LLM Validation & Context Management Library."""
 
-from wall_library.guard import WallGuard
-from wall_library.async_guard import AsyncGuard
+import importlib
+import importlib.util
+from typing import Any
+
 from wall_library.types.on_fail import OnFailAction
 from wall_library.validator_base import Validator, register_validator
-from wall_library.classes.validation_outcome import ValidationOutcome
-from wall_library.prompt import Prompt, Instructions, Messages
 from wall_library.version import __version__
 from wall_library.settings import settings
-from wall_library.logging import WallLogger, LogScope
 
 __version__ = __version__
 
+# Public names resolved on first access (PEP 562), so `import wall_library`
+# does not pay for the guard, logging or visualization stacks up front
+_LAZY_IMPORTS = {
+    "WallGuard": "wall_library.guard",
+    "AsyncGuard": "wall_library.async_guard",
+    "ValidationOutcome": "wall_library.classes.validation_outcome",
+    "Prompt": "wall_library.prompt",
+    "Instructions": "wall_library.prompt",
+    "Messages": "wall_library.prompt",
+    "WallLogger": "wall_library.logging",
+    "LogScope": "wall_library.logging",
+    # Optional: needs the visualization extras
+    "WallVisualizer": "wall_library.visualization",
+}
+
 __all__ = [
     "WallGuard",
     "AsyncGuard",
@@ -28,10 +42,22 @@ __all__ = [
     "__version__",
 ]
 
-# Optional visualization import
-try:
-    from wall_library.visualization import WallVisualizer
+# Optional: only advertised when a plotting backend for it is installed
+if any(importlib.util.find_spec(backend) is not None for backend in ("matplotlib", "plotly")):
     __all__.append("WallVisualizer")
-except ImportError:
-    pass
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError as e:
+        raise AttributeError(f"{name} is unavailable: {e}") from e
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,7 @@
 """Filter action implementation."""
 
+from itertools import compress
+from operator import attrgetter
 from typing import Any, List, Optional
 
 from wall_library.classes.validation.validation_result import FailResult, ValidationResult
@@ -32,10 +34,7 @@ class Filter:
         Returns:
             Filtered list with only valid values
         """
-        filtered = []
-        for i, (value, result) in enumerate(zip(values, fail_results)):
-            if result.is_pass:
-                filtered.append(value)
-        return filtered
+        # Selection runs in C; extra values beyond the results are dropped as zip did
+        return list(compress(values, map(attrgetter("is_pass"), fail_results)))
 
 
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 from wall_library.classes.validation.validation_result import FailResult
 
 
-@dataclass
+@dataclass(slots=True)
 class ReAsk:
     """Re-ask functionality for validation failures."""
 
@@ -18,7 +18,7 @@ class ReAsk:
         return f"ReAsk(value={self.value}, errors={len(self.fail_results)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class NonParseableReAsk:
     """Non-parseable re-ask."""
 
@@ -85,7 +85,7 @@ class AsyncGuard(Generic[OT], WallGuard[OT]):
             num_reasks=self.num_reasks,
         )
 
-        prompt = kwargs.get("prompt", "")
+        prompt = kwargs.pop("prompt", "")
         output = await runner.run(prompt=prompt, **kwargs)
 
         # Validate output
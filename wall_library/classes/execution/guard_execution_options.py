@@ -11,6 +11,8 @@ class GuardExecutionOptions:
     num_reasks: int = 0
     full_schema_reask: bool = False
     disable_tracer: bool = False
+    cache: bool = False
+    cache_size: int = 128
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __repr__(self) -> str:
@@ -3,12 +3,45 @@
 import json
 from typing import Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 from wall_library.formatters.base_formatter import BaseFormatter
 
 
+# Types the stdlib encoder rejects are passed through so orjson raises for them
+# too, and the fallback then fails the same way the stdlib path does
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if ORJSON_AVAILABLE
+    else 0
+)
+
+
 class JSONFormatter(BaseFormatter):
     """JSON output formatter."""
 
+    def __init__(self, use_orjson: bool = False):
+        """Initialize JSON formatter.
+
+        Args:
+            use_orjson: Encode with orjson when it is installed. The layout
+                (key order, 2-space indent, separators) and parsed value are
+                the same as the default stdlib encoder, but non-ASCII text is
+                written as UTF-8 rather than ``\\uXXXX`` escapes and float
+                exponents have no sign or padding (``1e20``, not ``1e+20``).
+                Enums and UUIDs are encoded instead of raising TypeError
+        """
+        self.use_orjson = use_orjson and ORJSON_AVAILABLE
+
     def format(self, data: Any) -> str:
         """Format data to JSON string.
 
@@ -18,6 +51,17 @@ class JSONFormatter(BaseFormatter):
         Returns:
             JSON string
         """
+        if self.use_orjson:
+            try:
+                encoded = orjson.dumps(data, option=_ORJSON_OPTIONS)
+            except TypeError:
+                # Types orjson can't serialize fall back to the stdlib encoder
+                pass
+            else:
+                # orjson writes NaN/Infinity as null; keep their values by
+                # leaving any payload that may hold them to the stdlib encoder
+                if b"null" not in encoded:
+                    return encoded.decode()
         return json.dumps(data, indent=2)
 
     def parse(self, text: str) -> Any:
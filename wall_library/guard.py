@@ -5,6 +5,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -13,7 +14,11 @@ from typing import (
     Union,
     overload,
 )
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
+import functools
+import os
 
 from wall_library.classes.output_type import OT
 from wall_library.classes.validation_outcome import ValidationOutcome
@@ -32,12 +37,40 @@ from wall_library.logger import logger
 from wall_library.stores.context import set_guard_name, set_tracer, Tracer
 from wall_library.settings import settings
 
+# Fast non-cryptographic hashing of long outputs for the validation cache (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
+# Outputs at least this long are keyed by their xxh3 digest instead of hash()
+_XXHASH_MIN_LENGTH = 1024
+
 # Validator registry context
 _validator_map_context: ContextVar[ValidatorMap] = ContextVar(
     "_validator_map", default={}
 )
 
 
+def _cache_value_key(value: Any) -> Any:
+    """Validation cache key for an output value.
+
+    Long strings are keyed by their xxh3 digest when xxhash is installed;
+    entries keep the value itself so a digest collision is never a hit.
+    """
+    if XXHASH_AVAILABLE and isinstance(value, str) and len(value) >= _XXHASH_MIN_LENGTH:
+        return ("xxh3", xxhash.xxh3_64_intdigest(value.encode("utf-8")))
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _validator_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for parallel validation, created on first use."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="wall-validator")
+
+
 class WallGuard(Generic[OT]):
     """Main Guard class for validating LLM outputs."""
 
@@ -67,6 +100,7 @@ class WallGuard(Generic[OT]):
         self.validator_map: ValidatorMap = {}
         self.processed_schema: Optional[ProcessedSchema] = None
         self.output_schema: Optional[Dict[str, Any]] = None
+        self._outcome_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
 
         if self.name:
             set_guard_name(self.name)
@@ -83,7 +117,16 @@ class WallGuard(Generic[OT]):
             set_tracer(kwargs["tracer"])
         if "logger" in kwargs:
             self.logger = kwargs["logger"]
+        if "cache" in kwargs:
+            self.exec_options.cache = kwargs["cache"]
+            self._outcome_cache.clear()
+        if "cache_size" in kwargs:
+            self.exec_options.cache_size = kwargs["cache_size"]
         return self
+
+    def clear_validation_cache(self):
+        """Drop all cached validation results."""
+        self._outcome_cache.clear()
     
     def set_logger(self, logger: Any):
         """Set logger for this guard.
@@ -106,27 +149,7 @@ class WallGuard(Generic[OT]):
         Returns:
             Self for chaining
         """
-        # Parse validator specification
-        if isinstance(validator, type) and issubclass(validator, Validator):
-            validator_instance = validator()
-        elif isinstance(validator, Validator):
-            validator_instance = validator
-        elif isinstance(validator, tuple):
-            validator_cls = validator[0]
-            kwargs = validator[1] if len(validator) > 1 else {}
-            on_fail = validator[2] if len(validator) > 2 else OnFailAction.EXCEPTION
-            validator_instance = validator_cls(on_fail=on_fail, **kwargs)
-        else:
-            raise ValueError(f"Invalid validator specification: {validator}")
-
-        self.validators.append(validator_instance)
-
-        # Update validator map
-        if on not in self.validator_map:
-            self.validator_map[on] = []
-        self.validator_map[on].append(validator_instance)
-
-        return self
+        return self.use_many(validator, on=on)
 
     def use_many(
         self, *validators: UseManyValidatorSpec, on: str = "output"
@@ -140,8 +163,43 @@ class WallGuard(Generic[OT]):
         Returns:
             Self for chaining
         """
-        for validator in validators:
-            self.use(validator, on=on)
+        # Build every instance first so an invalid spec leaves the guard untouched
+        instances = [self._make_validator(validator) for validator in validators]
+
+        self.validators.extend(instances)
+        self.validator_map.setdefault(on, []).extend(instances)
+        self._outcome_cache.clear()
+
+        return self
+
+    @staticmethod
+    def _make_validator(validator: UseValidatorSpec) -> Validator:
+        """Instantiate a validator from a use()/use_many() specification."""
+        if isinstance(validator, type) and issubclass(validator, Validator):
+            return validator()
+        if isinstance(validator, Validator):
+            return validator
+        if isinstance(validator, tuple):
+            validator_cls = validator[0]
+            kwargs = validator[1] if len(validator) > 1 else {}
+            on_fail = validator[2] if len(validator) > 2 else OnFailAction.EXCEPTION
+            return validator_cls(on_fail=on_fail, **kwargs)
+        raise ValueError(f"Invalid validator specification: {validator}")
+
+    def reset(self) -> "WallGuard[OT]":
+        """Remove all validators and restore default execution options in place.
+
+        Name, tracer and logger are kept, so a configured guard can be reused
+        without being rebuilt.
+
+        Returns:
+            Self for chaining
+        """
+        self.validators = []
+        self.validator_map = {}
+        self.num_reasks = 0
+        self.exec_options = GuardExecutionOptions()
+        self._outcome_cache.clear()
         return self
 
     @classmethod
@@ -216,32 +274,97 @@ class WallGuard(Generic[OT]):
         return guard
 
     def validate(
-        self, llm_output: str, *args, **kwargs
+        self, llm_output: str, *args, parallel: bool = False, **kwargs
     ) -> ValidationOutcome[OT]:
         """Validate LLM output.
 
         Args:
             llm_output: LLM output to validate
             *args: Additional arguments
+            parallel: Run the output validators concurrently on a shared thread
+                pool, so latency is bounded by the slowest validator
             **kwargs: Additional keyword arguments
 
+        With ``configure(cache=True)``, validator results for the most recent
+        ``cache_size`` outputs are reused when the same output is validated
+        again without metadata. Only enable it for deterministic validators.
+
         Returns:
             ValidationOutcome
         """
-        from wall_library.validator_service.sequential_validator_service import (
-            SequentialValidatorService,
+        return self._validate_output(
+            llm_output,
+            self.validator_map.get("output", []),
+            kwargs.get("metadata", {}),
+            parallel,
         )
 
-        # Get output validators
+    def validate_many(
+        self,
+        llm_outputs: Iterable[str],
+        *,
+        parallel: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[ValidationOutcome[OT]]:
+        """Validate several LLM outputs (e.g. stream chunks) against the output validators.
+
+        Validators are resolved once for the whole batch instead of per output.
+
+        Args:
+            llm_outputs: LLM outputs to validate
+            parallel: Run each output's validators concurrently, as in validate()
+            metadata: Metadata passed to every validator call
+
+        Returns:
+            One ValidationOutcome per output, in input order
+        """
         output_validators = self.validator_map.get("output", [])
+        metadata = metadata or {}
+        return [
+            self._validate_output(llm_output, output_validators, metadata, parallel)
+            for llm_output in llm_outputs
+        ]
 
-        # Run validators
-        service = SequentialValidatorService()
+    def _validate_output(
+        self,
+        llm_output: str,
+        output_validators: List[Validator],
+        metadata: Dict[str, Any],
+        parallel: bool,
+    ) -> ValidationOutcome[OT]:
+        """Run the given output validators on one output and build its outcome."""
         validation_results = []
         error_spans = []
 
-        for validator in output_validators:
-            result = validator.validate(llm_output, metadata=kwargs.get("metadata", {}))
+        cache_key = None
+        if self.exec_options.cache and not metadata:
+            cache_key = (tuple(id(v) for v in output_validators), _cache_value_key(llm_output))
+            try:
+                entry = self._outcome_cache.get(cache_key)
+            except TypeError:
+                # Unhashable outputs are validated uncached
+                cache_key = entry = None
+            if entry is not None and entry[0] == llm_output:
+                self._outcome_cache.move_to_end(cache_key)
+                results = entry[1]
+            else:
+                results = None
+        else:
+            results = None
+
+        if results is None:
+            if parallel and len(output_validators) > 1:
+                results = list(_validator_pool().map(
+                    lambda v: v.validate(llm_output, metadata=metadata), output_validators
+                ))
+            else:
+                results = [v.validate(llm_output, metadata=metadata) for v in output_validators]
+            if cache_key is not None:
+                self._outcome_cache[cache_key] = (llm_output, results)
+                if len(self._outcome_cache) > self.exec_options.cache_size:
+                    self._outcome_cache.popitem(last=False)
+
+        for validator, result in zip(output_validators, results):
             validation_results.append(result)
 
             if result.is_fail and hasattr(result, "error_spans"):
@@ -3,19 +3,48 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-import time
+import math
+
+import numpy as np
 
 from wall_library.monitoring.metrics_collector import MetricsCollector
 
+# Initial capacity of the latency column; grown by doubling when full
+_INITIAL_CAPACITY = 1024
+
 
 @dataclass
 class LLMMonitor:
-    """Monitor for tracking LLM interactions."""
+    """Monitor for tracking LLM interactions.
+
+    Besides the ``interactions`` records, track_call keeps the latencies in a
+    private growable float64 column so ``latencies`` needs no per-record walk.
+    """
 
     metrics_collector: MetricsCollector = field(default_factory=MetricsCollector)
     interactions: List[Dict[str, Any]] = field(default_factory=list)
     enable_telemetry: bool = True
     logger: Optional[Any] = field(default=None)
+    _latencies: np.ndarray = field(
+        default_factory=lambda: np.empty(_INITIAL_CAPACITY, dtype=np.float64),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _latency_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def interaction_count(self) -> int:
+        """Number of tracked interactions."""
+        return len(self.interactions)
+
+    @property
+    def latencies(self) -> np.ndarray:
+        """Latencies in seconds of the calls made through track_call, NaN where
+        none was given (read-only view)."""
+        view = self._latencies[: self._latency_count]
+        view.flags.writeable = False
+        return view
 
     def track_call(
         self,
@@ -42,6 +71,11 @@ class LLMMonitor:
 
         self.interactions.append(interaction)
 
+        if self._latency_count == len(self._latencies):
+            self._latencies = np.resize(self._latencies, 2 * self._latency_count)
+        self._latencies[self._latency_count] = math.nan if latency is None else latency
+        self._latency_count += 1
+
         # Update metrics
         if latency is not None:
             self.metrics_collector.record_latency(latency)
@@ -50,7 +84,7 @@ class LLMMonitor:
         # Export to OpenTelemetry if enabled
         if self.enable_telemetry:
             self._export_telemetry(interaction)
-        
+
         # Log LLM call if logger is set
         if self.logger:
             self.logger.log_llm_call(
@@ -59,10 +93,10 @@ class LLMMonitor:
                 metadata=metadata,
                 latency=latency,
             )
-    
+
     def set_logger(self, logger: Any):
         """Set logger for this monitor.
-        
+
         Args:
             logger: WallLogger instance
         """
@@ -81,7 +115,6 @@ class LLMMonitor:
             Statistics dictionary
         """
         return {
-            "total_interactions": len(self.interactions),
+            "total_interactions": self.interaction_count,
             "metrics": self.metrics_collector.get_stats(),
         }
-
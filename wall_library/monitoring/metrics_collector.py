@@ -2,7 +2,8 @@
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
-import statistics
+import math
+import numpy as np
 
 
 @dataclass
@@ -13,6 +14,33 @@ class MetricsCollector:
     errors: List[str] = field(default_factory=list)
     successes: int = 0
     failures: int = 0
+    # Running (Welford) moments and extremes over ``latencies``, kept in step
+    # by record_latency and rebuilt when the list's length no longer matches
+    # (values passed at init, or appends/clears made on the list directly)
+    _latency_count: int = field(default=0, init=False, repr=False, compare=False)
+    _latency_mean: float = field(default=0.0, init=False, repr=False, compare=False)
+    _latency_m2: float = field(default=0.0, init=False, repr=False, compare=False)
+    _latency_min: float = field(default=math.inf, init=False, repr=False, compare=False)
+    _latency_max: float = field(default=-math.inf, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.latencies:
+            self._resync_latency_moments()
+
+    def _update_latency_moments(self, latency: float):
+        self._latency_count += 1
+        delta = latency - self._latency_mean
+        self._latency_mean += delta / self._latency_count
+        self._latency_m2 += delta * (latency - self._latency_mean)
+        self._latency_min = min(self._latency_min, latency)
+        self._latency_max = max(self._latency_max, latency)
+
+    def _resync_latency_moments(self):
+        self._latency_count = 0
+        self._latency_mean = self._latency_m2 = 0.0
+        self._latency_min, self._latency_max = math.inf, -math.inf
+        for latency in self.latencies:
+            self._update_latency_moments(float(latency))
 
     def record_latency(self, latency: float):
         """Record a latency measurement.
@@ -21,6 +49,8 @@ class MetricsCollector:
             latency: Latency in seconds
         """
         self.latencies.append(latency)
+        if self._latency_count == len(self.latencies) - 1:
+            self._update_latency_moments(float(latency))
 
     def record_success(self):
         """Record a successful interaction."""
@@ -52,17 +82,21 @@ class MetricsCollector:
         }
 
         if self.latencies:
+            if self._latency_count != len(self.latencies):
+                self._resync_latency_moments()
+            # Order statistics need the samples; everything else is kept running
+            median, p95 = np.percentile(self.latencies, [50, 95])
+            n = self._latency_count
             stats["latency"] = {
-                "mean": statistics.mean(self.latencies),
-                "median": statistics.median(self.latencies),
-                "min": min(self.latencies),
-                "max": max(self.latencies),
-                "std_dev": statistics.stdev(self.latencies) if len(self.latencies) > 1 else 0.0,
+                "mean": self._latency_mean,
+                "median": float(median),
+                "p95": float(p95),
+                "min": self._latency_min,
+                "max": self._latency_max,
+                "std_dev": math.sqrt(self._latency_m2 / (n - 1)) if n > 1 else 0.0,
             }
 
         if self.errors:
             stats["error_count"] = len(self.errors)
 
         return stats
-
-
@@ -1,8 +1,44 @@
 """Keyword matcher for context filtering."""
 
-from typing import List, Set, Union
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, Set, Union
 import re
 
+# Aho-Corasick automaton for multi-keyword search (optional, falls back to regex)
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    _AHOCORASICK_AVAILABLE = False
+
+
+@lru_cache(maxsize=128)
+def _compile_keywords(keywords: FrozenSet[str]) -> Callable[[str], bool]:
+    """Compile a keyword set into a single-pass substring search.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a regex alternation of the keywords.
+
+    Args:
+        keywords: Keywords to compile (already case-normalized)
+
+    Returns:
+        Predicate that is True if any keyword occurs in the text
+    """
+    # The empty keyword matches everywhere; the automaton cannot hold it
+    if _AHOCORASICK_AVAILABLE and "" not in keywords:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    # Longest first so overlapping keywords resolve to the most specific term
+    ordered = sorted(keywords, key=lambda k: (-len(k), k))
+    pattern = re.compile("|".join(re.escape(k) for k in ordered))
+    return lambda text: pattern.search(text) is not None
+
 
 class KeywordMatcher:
     """Keyword matcher for exact and fuzzy keyword matching."""
@@ -30,13 +66,12 @@ class KeywordMatcher:
 
         if not self.case_sensitive:
             text = text.lower()
-            keywords = [k.lower() if isinstance(k, str) else str(k).lower() for k in keywords]
+            keywords = frozenset(k.lower() if isinstance(k, str) else str(k).lower() for k in keywords)
+        else:
+            keywords = frozenset(k if isinstance(k, str) else str(k) for k in keywords)
 
-        for keyword in keywords:
-            if keyword in text:
-                return True
-
-        return False
+        # One scan over the text instead of one substring test per keyword
+        return _compile_keywords(keywords)(text)
 
     def fuzzy_match(self, text: str, keywords: List[str], threshold: float = 0.8) -> bool:
         """Fuzzy match keywords in text.
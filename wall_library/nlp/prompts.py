@@ -1,6 +1,10 @@
 """Prompts for Context Manager LLM Verification."""
 
-CONTEXT_VALIDATION_COT_PROMPT = """
+# The CoT prompt is split just before the user input, so the part holding the
+# context and keywords forms a stable prefix: it only changes when the context
+# does, which lets provider-side prompt/prefix caching reuse it across queries.
+# Joined, the two parts are the original single prompt.
+CONTEXT_VALIDATION_COT_PREFIX = """
 You are an advanced Context Verification Guard. Your task is to determine if a user's input aligns with the allowed context and constraints provided below.
 
 ### Allowed Context & Guidelines
@@ -9,7 +13,9 @@ You are an advanced Context Verification Guard. Your task is to determine if a u
 ### Required Keywords (if any)
 {keywords}
 
-### User Input
+"""
+
+CONTEXT_VALIDATION_COT_SUFFIX = """### User Input
 {text}
 
 ### Instructions
@@ -24,3 +30,30 @@ Analyze the user input step-by-step using the following Chain of Thought process
 You must output your reasoning followed by the final verdict.
 final_answer: <YES or NO>
 """
+
+CONTEXT_VALIDATION_COT_PROMPT = CONTEXT_VALIDATION_COT_PREFIX + CONTEXT_VALIDATION_COT_SUFFIX
+
+CONTEXT_VALIDATION_COT_BATCH_PROMPT = """
+You are an advanced Context Verification Guard. Your task is to determine, for each numbered user input below, if it aligns with the allowed context and constraints provided.
+
+### Allowed Context & Guidelines
+{context}
+
+### Required Keywords (if any)
+{keywords}
+
+### User Inputs
+{rows}
+
+### Instructions
+Analyze each user input independently, step-by-step, using the following Chain of Thought process:
+1.  **Analyze Intent**: What is the user trying to achieve with this input?
+2.  **Context Alignment**: Does this intent fall strictly within the scope of the provided 'Allowed Context'?
+3.  **Keyword Verification**: If keywords are provided, are they present or conceptually represented in a way that satisfies the requirement?
+4.  **Constraint Check**: Does the input violate any negative constraints or boundary conditions implied by the context?
+5.  **Final Verdict**: Based on the above, is this input ALLOWED or BLOCKED?
+
+### Output Format
+You must output your reasoning for each row, followed by one final verdict line per row:
+{answers}
+"""
@@ -1,14 +1,36 @@
 """Similarity engine for context filtering."""
 
-from typing import Optional, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, List, Sequence
+import re
+import threading
 import numpy as np
 
-try:
-    from sklearn.metrics.pairwise import cosine_similarity
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    cosine_similarity = None  # type: ignore
+# Extract words using regex to handle punctuation better
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+# Filter common stop words to prevent false positives
+# Expanded list for strict accuracy
+_JACCARD_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'was', 'are', 'with', 'that', 'this', 'from', 'which', 'who', 'what', 'where', 'when', 'why', 'how',
+    'a', 'an', 'in', 'on', 'at', 'to', 'of', 'is', 'it', 'or', 'be', 'as', 'by'
+})
+
+
+# Texts whose embeddings are kept per sentence-transformer model
+_EMBEDDING_CACHE_SIZE = 1024
+
+# Embedding caches are shared by every engine using the same model
+_embedding_caches: Dict[str, "OrderedDict[str, np.ndarray]"] = {}
+_embedding_cache_lock = threading.Lock()
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased words longer than two characters, minus stop words."""
+    words = {w for w in _WORD_RE.findall(text.lower()) if len(w) > 2}
+    return frozenset(words - _JACCARD_STOP_WORDS)
+
 
 # Lazy import to avoid breaking if sentence-transformers has dependency issues
 SENTENCE_TRANSFORMERS_AVAILABLE = False
@@ -73,6 +95,12 @@ def _try_import_sentence_transformers():
 from wall_library.logger import logger
 
 
+@lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str):
+    """Load a sentence-transformer once per process and model name."""
+    return SentenceTransformer(model_name)
+
+
 class SimilarityEngine:
     """Similarity engine using cosine similarity and semantic similarity."""
 
@@ -88,13 +116,15 @@ class SimilarityEngine:
             use_semantic: Whether to use semantic similarity
         """
         self.model: Optional[SentenceTransformer] = None
+        self.model_name = model_name or "all-MiniLM-L6-v2"
+        with _embedding_cache_lock:
+            self._embedding_cache = _embedding_caches.setdefault(self.model_name, OrderedDict())
         
         # Try to import sentence-transformers first, then check if we can use semantic similarity
         if use_semantic:
             if _try_import_sentence_transformers() and SentenceTransformer:
                 try:
-                    model_name = model_name or "all-MiniLM-L6-v2"
-                    self.model = SentenceTransformer(model_name)
+                    self.model = _load_sentence_transformer(self.model_name)
                     self.use_semantic = True
                 except Exception as e:
                     logger.warning(f"Failed to load sentence transformer: {e}")
@@ -119,66 +149,110 @@ class SimilarityEngine:
         else:
             return self._simple_cosine_similarity(text1, text2)
 
+    def cosine_similarity_batch(self, texts1: List[str], texts2: List[str]) -> np.ndarray:
+        """Calculate similarity for aligned pairs of texts.
+
+        With a semantic model, all texts are embedded in one encode call and
+        the pairwise cosines are taken as row-wise dot products.
+
+        Args:
+            texts1: First texts
+            texts2: Second texts, aligned with texts1
+
+        Returns:
+            Array of similarity scores between 0 and 1, one per pair
+        """
+        if len(texts1) != len(texts2):
+            raise ValueError("texts1 and texts2 must have the same length")
+        if not texts1:
+            return np.zeros(0)
+
+        if self.use_semantic and self.model:
+            embeddings = self._encode(list(texts1) + list(texts2))
+            n = len(texts1)
+            return np.einsum("ij,ij->i", embeddings[:n], embeddings[n:])
+
+        return np.array(
+            [self._simple_cosine_similarity(t1, t2) for t1, t2 in zip(texts1, texts2)]
+        )
+
     def _semantic_similarity(self, text1: str, text2: str) -> float:
         """Calculate semantic similarity using sentence transformers."""
         if self.model is None:
             return 0.0
 
-        embeddings = self.model.encode([text1, text2])
-        if SKLEARN_AVAILABLE and cosine_similarity:
-            similarity_matrix = cosine_similarity([embeddings[0]], [embeddings[1]])
-            return float(similarity_matrix[0][0])
-        else:
-            # Fallback to manual cosine similarity
-            vec1 = embeddings[0]
-            vec2 = embeddings[1]
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            return float(dot_product / (norm1 * norm2))
+        # Unit-normalized embeddings reduce cosine similarity to a single dot product
+        embeddings = self._encode([text1, text2])
+        return float(embeddings[0] @ embeddings[1])
 
-    def _simple_cosine_similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple cosine similarity using word vectors.
-        
-        Uses Jaccard similarity (intersection over union) which is better
-        for semantic matching than exact word overlap.
-        Also includes partial word matching for better domain term matching.
+    def _encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Unit-normalized float32 embeddings, one row per text.
+
+        Recently seen texts are served from an LRU cache shared by all
+        engines on the same model; the rest are encoded together in a single
+        model call.
+        """
+        cache = self._embedding_cache
+        with _embedding_cache_lock:
+            found = {t: cache[t] for t in texts if t in cache}
+        missing = list(dict.fromkeys(t for t in texts if t not in found))
+        if missing:
+            encoded = np.asarray(
+                self.model.encode(missing, normalize_embeddings=True), dtype=np.float32
+            )
+            found.update(zip(missing, encoded))
+
+        rows = np.stack([found[t] for t in texts])
+        with _embedding_cache_lock:
+            for text in found:
+                cache[text] = found[text]
+                cache.move_to_end(text)
+            while len(cache) > _EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
+        return rows
+
+    def tokenize(self, text: str) -> FrozenSet[str]:
+        """Extract the lexical token set used by the Jaccard similarity.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Lowercased words longer than two characters, minus stop words
+        """
+        return _tokenize(text)
+
+    def token_similarity(self, words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+        """Calculate Jaccard similarity between two precomputed token sets.
+
+        Args:
+            words1: Token set from tokenize()
+            words2: Token set from tokenize()
+
+        Returns:
+            Similarity score between 0 and 1
         """
-        # Extract words using regex to handle punctuation better
-        import re
-        words1 = set(re.findall(r'\b[a-zA-Z]+\b', text1.lower()))
-        words2 = set(re.findall(r'\b[a-zA-Z]+\b', text2.lower()))
-        
-        # Remove very short words (1-2 chars) as they're usually not meaningful
-        words1 = {w for w in words1 if len(w) > 2}
-        words2 = {w for w in words2 if len(w) > 2}
-
-        # Filter common stop words to prevent false positives
-        # Expanded list for strict accuracy
-        stop_words = {
-            'the', 'and', 'for', 'was', 'are', 'with', 'that', 'this', 'from', 'which', 'who', 'what', 'where', 'when', 'why', 'how',
-            'a', 'an', 'in', 'on', 'at', 'to', 'of', 'is', 'it', 'or', 'be', 'as', 'by'
-        }
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-        
         if not words1 or not words2:
             return 0.0
-        
+
         # Calculate Strict Jaccard similarity
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
+        intersection = words1 & words2
+        union = words1 | words2
+
         if not union:
             return 0.0
-        
+
         similarity = len(intersection) / len(union)
-        
-        # DEBUG: Print matches to understand score
+
         if similarity > 0.0:
-           print(f"DEBUG: Match found: {intersection} -> Score: {similarity:.2f}")
+            logger.debug("Jaccard match %s -> score %.2f", intersection, similarity)
 
         return similarity
 
+    def _simple_cosine_similarity(self, text1: str, text2: str) -> float:
+        """Calculate simple cosine similarity using word vectors.
+        
+        Uses Jaccard similarity (intersection over union) which is better
+        for semantic matching than exact word overlap.
+        """
+        return self.token_similarity(self.tokenize(text1), self.tokenize(text2))
@@ -11,6 +11,9 @@ except ImportError:
     CHROMADB_AVAILABLE = False
     chromadb = None  # type: ignore
 
+# Records per collection.add call; stays under Chroma's default max batch size (5461)
+_MAX_ADD_BATCH_SIZE = 5000
+
 
 class ChromaDBClient:
     """ChromaDB client wrapper for vector storage and retrieval."""
@@ -74,11 +77,47 @@ class ChromaDBClient:
         texts = [f"{q} {a}" for q, a in zip(questions, answers)]
 
         ids = [f"qa_{i}" for i in range(len(texts))]
-        self.collection.add(
-            documents=texts,
-            ids=ids,
-            metadatas=metadata,
-        )
+        self._add_batched(texts, ids, metadata)
+
+    def add_texts(
+        self,
+        texts: List[str],
+        ids: Optional[List[str]] = None,
+        metadata: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """Add plain texts to the collection in a single batch.
+
+        Args:
+            texts: List of texts
+            ids: Optional ids for each text (generated when omitted)
+            metadata: Optional metadata for each text
+        """
+        if ids is None:
+            offset = self.collection.count()
+            ids = [f"doc_{offset + i}" for i in range(len(texts))]
+        if len(ids) != len(texts):
+            raise ValueError("Texts and ids must have the same length")
+
+        if metadata is None:
+            # Provide default metadata to avoid ChromaDB error
+            metadata = [{"type": "text", "index": i} for i in range(len(texts))]
+
+        self._add_batched(texts, ids, metadata)
+
+    def _add_batched(
+        self,
+        texts: List[str],
+        ids: List[str],
+        metadata: List[Dict[str, Any]],
+    ):
+        """Add records with as few collection.add calls as Chroma's batch limit allows."""
+        for start in range(0, len(texts), _MAX_ADD_BATCH_SIZE):
+            end = start + _MAX_ADD_BATCH_SIZE
+            self.collection.add(
+                documents=texts[start:end],
+                ids=ids[start:end],
+                metadatas=metadata[start:end],
+            )
 
     def query(
         self, query_text: str, n_results: int = 5
@@ -1,5 +1,6 @@
 """Async runner for async LLM execution."""
 
+import inspect
 from typing import Any, Callable, Dict, Optional
 
 from wall_library.run.runner import Runner
@@ -31,8 +32,10 @@ class AsyncRunner(Runner):
         if isinstance(self.async_api, AsyncPromptCallableBase):
             output = await self.async_api(prompt, **kwargs)
         else:
-            # Fallback to sync call
+            # Fallback to sync call; plain coroutine functions are awaited too
             output = self.async_api(prompt, **kwargs)
+            if inspect.isawaitable(output):
+                output = await output
 
         if isinstance(output, str):
             return output
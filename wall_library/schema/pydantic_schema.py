@@ -1,6 +1,8 @@
 """Pydantic schema conversion utilities."""
 
 from typing import Any, Dict, List, Type, Union, get_origin, get_args
+import copy
+import functools
 import json
 
 try:
@@ -42,18 +44,24 @@ def pydantic_model_to_schema(
             return {"anyOf": schemas}
 
     if isinstance(model, type) and issubclass(model, BaseModel):
-        try:
-            # Use Pydantic's built-in schema generation
-            schema = model.model_json_schema()
-            return schema
-        except Exception as e:
-            logger.warning(f"Failed to generate schema from Pydantic model: {e}")
-            # Fallback to basic schema
-            return {
-                "type": "object",
-                "properties": {},
-            }
+        # Callers get their own copy; the cached schema is never handed out
+        return copy.deepcopy(_model_json_schema(model))
     else:
         raise ValueError(f"Invalid Pydantic model: {model}")
 
 
+@functools.lru_cache(maxsize=128)
+def _model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """JSON schema of a Pydantic model class, generated once per class."""
+    try:
+        # Use Pydantic's built-in schema generation
+        return model.model_json_schema()
+    except Exception as e:
+        logger.warning(f"Failed to generate schema from Pydantic model: {e}")
+        # Fallback to basic schema
+        return {
+            "type": "object",
+            "properties": {},
+        }
+
+
@@ -1,7 +1,10 @@
 """RAIL schema parsing utilities."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from pathlib import Path
+import copy
+import functools
+import threading
 from lxml import etree as ET
 
 from wall_library.logger import logger
@@ -12,6 +15,18 @@ from wall_library.utils.xml_utils import xml_to_string
 from wall_library.utils.regex_utils import split_on
 from wall_library.validator_base import get_validator
 
+# lxml parser objects must not be shared between threads; each thread builds one once
+_parser_local = threading.local()
+
+
+def _get_parser() -> ET.XMLParser:
+    """Return this thread's reusable RAIL XML parser."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = ET.XMLParser(remove_blank_text=True, collect_ids=False, huge_tree=False)
+        _parser_local.parser = parser
+    return parser
+
 
 def parse_on_fail_handlers(element: ET._Element) -> Dict[str, OnFailAction]:
     """Parse on-fail handlers from XML element.
@@ -45,8 +60,15 @@ def get_validators_from_element(element: ET._Element) -> List:
         List of validator classes
     """
     validators_string: str = xml_to_string(element.attrib.get("validators", "")) or ""
+    return _resolve_validators(validators_string, parse_on_fail_handlers(element))
+
+
+def _resolve_validators(validators_string: str, on_fail_handlers: Dict[str, OnFailAction]) -> List:
+    """Look up the validator classes named in a ``validators`` attribute.
+
+    Aliases that are not registered (yet) are skipped.
+    """
     validator_specs = split_on(validators_string, ";")
-    on_fail_handlers = parse_on_fail_handlers(element)
     validators = []
 
     for v_spec in validator_specs:
@@ -89,31 +111,46 @@ def rail_string_to_schema(rail_string: str) -> ProcessedSchema:
     Returns:
         ProcessedSchema instance
     """
-    try:
-        parser = ET.XMLParser(remove_blank_text=True)
-        root = ET.fromstring(rail_string.encode(), parser=parser)
+    schema_dict, validators_string, on_fail_handlers = _parse_rail_string(rail_string)
 
-        processed_schema = ProcessedSchema()
+    processed_schema = ProcessedSchema()
+    if schema_dict is not None:
+        # Only the XML parse is cached per RAIL string; validators are looked
+        # up in the registry on every call, and the schema dict and validator
+        # instances are fresh for every caller
+        processed_schema.schema = copy.deepcopy(schema_dict)
+        for validator_cls, on_fail in _resolve_validators(validators_string, dict(on_fail_handlers)):
+            processed_schema.add_validator(
+                validator_cls(), json_path="output", on_fail=on_fail
+            )
 
-        # Extract output schema
-        output_element = root.find(".//output")
-        if output_element is not None:
-            schema_dict = _element_to_schema_dict(output_element)
-            processed_schema.schema = schema_dict
+    return processed_schema
 
-            # Extract validators
-            validators = get_validators_from_element(output_element)
-            for validator_cls, on_fail in validators:
-                processed_schema.add_validator(
-                    validator_cls(), on="output", on_fail=on_fail
-                )
 
-        return processed_schema
+@functools.lru_cache(maxsize=128)
+def _parse_rail_string(rail_string: str) -> Tuple[Any, str, Tuple]:
+    """Parse a RAIL string into its output schema dict and validator specs.
 
+    Returns:
+        (schema dict or None without an <output> element, the output's
+        ``validators`` attribute, ((validator name, on_fail), ...))
+    """
+    try:
+        root = ET.fromstring(rail_string.encode("utf-8"), parser=_get_parser())
     except ET.XMLSyntaxError as e:
         logger.error(f"Invalid RAIL XML: {e}")
         raise ValueError(f"Invalid RAIL specification: {e}")
 
+    # Extract output schema
+    output_element = root.find(".//output")
+    if output_element is None:
+        return None, "", ()
+    return (
+        _element_to_schema_dict(output_element),
+        xml_to_string(output_element.attrib.get("validators", "")) or "",
+        tuple(parse_on_fail_handlers(output_element).items()),
+    )
+
 
 def _element_to_schema_dict(element: ET._Element) -> Dict[str, Any]:
     """Convert XML element to schema dictionary."""
@@ -129,15 +166,14 @@ def _element_to_schema_dict(element: ET._Element) -> Dict[str, Any]:
             schema[key.replace("-", "_")] = value
 
     # Get children
-    if element.getchildren():
+    if len(element):
         if tag in ["object", "dict"]:
             schema["properties"] = {}
             for child in element:
                 child_name = child.get("name", child.tag)
                 schema["properties"][child_name] = _element_to_schema_dict(child)
         elif tag in ["array", "list"]:
-            if element.getchildren():
-                schema["items"] = _element_to_schema_dict(element[0])
+            schema["items"] = _element_to_schema_dict(element[0])
 
     return schema
 
@@ -1,14 +1,19 @@
 """Scoring metrics implementations."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Callable, Optional
+import re
 
 try:
-    from rouge_score import rouge_scorer
+    from rouge_score import rouge_scorer, tokenizers as rouge_tokenizers
+    from nltk.stem.porter import PorterStemmer  # rouge_score's own stemmer dependency
     ROUGE_AVAILABLE = True
 except ImportError:
     ROUGE_AVAILABLE = False
     rouge_scorer = None  # type: ignore
+    rouge_tokenizers = None  # type: ignore
+    PorterStemmer = None  # type: ignore
 
 try:
     from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction
@@ -37,6 +42,20 @@ class BaseMetric(ABC):
         """
         pass
 
+    def compute_batch(self, responses: List[str], expected: List[str]) -> List[float]:
+        """Compute metric scores for aligned lists of responses and expected outputs.
+
+        Subclasses override this when scoring many pairs at once is cheaper.
+
+        Args:
+            responses: LLM responses
+            expected: Expected outputs, aligned with responses
+
+        Returns:
+            Scores between 0 and 1, one per pair
+        """
+        return [self.compute(r, e) for r, e in zip(responses, expected)]
+
 
 class CosineSimilarityMetric(BaseMetric):
     """Cosine similarity metric."""
@@ -49,6 +68,10 @@ class CosineSimilarityMetric(BaseMetric):
         """Compute cosine similarity score."""
         return self.similarity_engine.cosine_similarity(response, expected)
 
+    def compute_batch(self, responses: List[str], expected: List[str]) -> List[float]:
+        """Compute cosine similarity scores for aligned pairs."""
+        return self.similarity_engine.cosine_similarity_batch(responses, expected).tolist()
+
 
 class SemanticSimilarityMetric(BaseMetric):
     """Semantic similarity metric using sentence transformers."""
@@ -61,6 +84,32 @@ class SemanticSimilarityMetric(BaseMetric):
         """Compute semantic similarity score."""
         return self.similarity_engine.cosine_similarity(response, expected)
 
+    def compute_batch(self, responses: List[str], expected: List[str]) -> List[float]:
+        """Compute semantic similarity scores with one embedding pass for all pairs."""
+        return self.similarity_engine.cosine_similarity_batch(responses, expected).tolist()
+
+
+# ROUGE tokens: lowercase ASCII alphanumeric runs, as in rouge_score's tokenizer
+_ROUGE_TOKEN_RE = re.compile(r"[a-z0-9]+", re.ASCII)
+
+
+if ROUGE_AVAILABLE:
+
+    class _StemCachingRougeTokenizer(rouge_tokenizers.Tokenizer):
+        """rouge_score's default tokenizer with one regex pass and memoized stems.
+
+        Produces the same tokens as ``DefaultTokenizer(use_stemmer=True)``.
+        """
+
+        def __init__(self):
+            self._stem = lru_cache(maxsize=8192)(PorterStemmer().stem)
+
+        def tokenize(self, text: str) -> List[str]:
+            tokens = _ROUGE_TOKEN_RE.findall(text.lower())
+            # Only words longer than three characters are stemmed
+            tokens = [self._stem(t) if len(t) > 3 else t for t in tokens]
+            return [t for t in tokens if _ROUGE_TOKEN_RE.fullmatch(t)]
+
 
 class ROUGEMetric(BaseMetric):
     """ROUGE metric for summarization evaluation."""
@@ -72,7 +121,9 @@ class ROUGEMetric(BaseMetric):
 
         rouge_types = rouge_types or ["rouge1", "rouge2", "rougeL"]
         self.rouge_types = rouge_types
-        self.scorer = rouge_scorer.RougeScorer(rouge_types, use_stemmer=True)
+        self.scorer = rouge_scorer.RougeScorer(
+            rouge_types, tokenizer=_StemCachingRougeTokenizer()
+        )
 
     def compute(self, response: str, expected: str) -> float:
         """Compute ROUGE score."""
@@ -1,7 +1,8 @@
 """Response scorer for LLM responses."""
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
+import asyncio
 
 from wall_library.scoring.metrics import (
     CosineSimilarityMetric,
@@ -47,24 +48,105 @@ class ResponseScorer:
         """
         scores = {}
 
-        for metric in self.metrics:
+        for metric in self._selected_metrics(metric_names):
+            scores[metric.__class__.__name__] = self._compute_metric(metric, response, expected)
+
+        self._log_scores(response, scores)
+        return scores
+
+    async def async_score(
+        self,
+        response: str,
+        expected: str,
+        metric_names: Optional[List[str]] = None,
+    ) -> Dict[str, float]:
+        """Score response against expected output, running metrics concurrently.
+
+        Each metric is computed in a worker thread, so total latency approaches
+        that of the slowest metric rather than the sum of all of them.
+
+        Args:
+            response: LLM response
+            expected: Expected output
+            metric_names: Optional list of metric names to use
+
+        Returns:
+            Dictionary of metric scores
+        """
+        metrics = self._selected_metrics(metric_names)
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._compute_metric, metric, response, expected)
+                for metric in metrics
+            )
+        )
+        scores = {
+            metric.__class__.__name__: score for metric, score in zip(metrics, results)
+        }
+
+        self._log_scores(response, scores)
+        return scores
+
+    def score_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        metric_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, float]]:
+        """Score many (response, expected) pairs, one metric pass per metric.
+
+        Metrics that support batching (e.g. semantic similarity) embed every
+        pair in a single forward pass instead of one pass per pair.
+
+        Args:
+            pairs: List of (response, expected) tuples
+            metric_names: Optional list of metric names to use
+
+        Returns:
+            List of metric score dictionaries, one per pair
+        """
+        responses = [response for response, _ in pairs]
+        expected = [exp for _, exp in pairs]
+        batch_scores: List[Dict[str, float]] = [{} for _ in pairs]
+
+        for metric in self._selected_metrics(metric_names):
             metric_name = metric.__class__.__name__
-            if metric_names is None or metric_name in metric_names:
-                try:
-                    score = metric.compute(response, expected)
-                    scores[metric_name] = score
-                except Exception as e:
-                    scores[metric_name] = 0.0
-        
-        # Log scoring if logger is set
+            try:
+                metric_scores = metric.compute_batch(responses, expected)
+            except Exception:
+                # Fall back to per-pair scoring so one bad pair only zeroes itself
+                metric_scores = [
+                    self._compute_metric(metric, r, e) for r, e in zip(responses, expected)
+                ]
+            for scores, score in zip(batch_scores, metric_scores):
+                scores[metric_name] = score
+
+        for response, scores in zip(responses, batch_scores):
+            self._log_scores(response, scores)
+        return batch_scores
+
+    def _selected_metrics(self, metric_names: Optional[List[str]]) -> List[Any]:
+        """Get the metrics to run, filtered by class name if requested."""
+        return [
+            metric
+            for metric in self.metrics
+            if metric_names is None or metric.__class__.__name__ in metric_names
+        ]
+
+    def _compute_metric(self, metric: Any, response: str, expected: str) -> float:
+        """Compute a single metric, scoring 0.0 if it raises."""
+        try:
+            return metric.compute(response, expected)
+        except Exception:
+            return 0.0
+
+    def _log_scores(self, response: str, scores: Dict[str, float]):
+        """Log scoring if logger is set."""
         if self.logger and scores:
             self.logger.log_scoring(
                 response=response,
                 scores=scores,
                 metadata={"num_metrics": len(scores)},
             )
-
-        return scores
     
     def set_logger(self, logger: Any):
         """Set logger for this scorer.
@@ -23,6 +23,9 @@ from wall_library.utils.tokenization_utils import postproc_splits
 # Validator registry
 _VALIDATOR_REGISTRY: Dict[str, Type["Validator"]] = {}
 
+# Lowercase on_fail strings mapped to their action, resolved once at import
+_ON_FAIL_MAP: Dict[str, OnFailAction] = {action.value: action for action in OnFailAction}
+
 
 # Export registry for external access
 __all__ = ["Validator", "register_validator", "get_validator", "_VALIDATOR_REGISTRY"]
@@ -30,10 +33,11 @@ __all__ = ["Validator", "register_validator", "get_validator", "_VALIDATOR_REGIS
 
 def split_sentence_str(chunk: str) -> List[str]:
     """A naive sentence splitter that splits on periods."""
-    if "." not in chunk:
+    # partition stops at the first period instead of splitting and re-joining the rest
+    head, sep, tail = chunk.partition(".")
+    if not sep:
         return []
-    fragments = chunk.split(".")
-    return [fragments[0] + ".", ".".join(fragments[1:])]
+    return [head + ".", tail]
 
 
 def split_sentence_word_tokenizers_jl_separator(
@@ -103,15 +107,11 @@ class Validator:
 
         if on_fail is None:
             on_fail = OnFailAction.EXCEPTION
+        elif isinstance(on_fail, str) and not isinstance(on_fail, OnFailAction):
+            on_fail = _ON_FAIL_MAP.get(on_fail.lower(), on_fail)
         if isinstance(on_fail, OnFailAction):
             self.on_fail_descriptor = on_fail
             self.on_fail_method = None
-        elif (
-            isinstance(on_fail, str)
-            and OnFailAction.__members__.get(on_fail.upper()) is not None
-        ):
-            self.on_fail_descriptor = OnFailAction[on_fail.upper()]
-            self.on_fail_method = None
         elif callable(on_fail):
             self.on_fail_descriptor = OnFailAction.CUSTOM
             self.on_fail_method = on_fail
@@ -1,6 +1,6 @@
 """Comprehensive visualization module for Wall Library."""
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 import os
 import warnings
 
@@ -51,6 +51,12 @@ except ImportError:
     sns = None
 
 
+def _latency_summary(latencies: "np.ndarray") -> Tuple[float, float, float]:
+    """Mean, median and p95 of a non-empty latency array (both percentiles in one pass)."""
+    p50, p95 = np.percentile(latencies, (50, 95))
+    return float(latencies.mean()), float(p50), float(p95)
+
+
 class WallVisualizer:
     """Main visualization class for Wall Library."""
     
@@ -344,20 +350,26 @@ class WallVisualizer:
     
     def visualize_3d_embeddings(
         self,
-        embeddings: List[List[float]],
-        labels: Optional[List[str]] = None,
+        embeddings: Any,
+        labels: Optional[Iterable[Any]] = None,
         title: str = "3D Embedding Visualization",
         save_path: Optional[str] = None,
-        show: bool = False
+        show: bool = False,
+        scale: Optional[float] = None,
+        zero_point: float = 0.0,
     ) -> Optional[str]:
         """Visualize embeddings in 3D space.
         
         Args:
-            embeddings: List of embedding vectors
-            labels: Optional labels for points
+            embeddings: Embedding vectors as an (n, d) array or list of vectors
+            labels: Optional labels for points (strings or dicts); any iterable,
+                including a generator, which is consumed once
             title: Plot title
             save_path: Path to save HTML file
             show: Whether to display plot
+            scale: Quantization scale for integer (e.g. uint8) embeddings; values
+                are dequantized as (q - zero_point) * scale at plot time
+            zero_point: Quantization zero point used with scale
             
         Returns:
             Path to saved file or None
@@ -370,8 +382,15 @@ class WallVisualizer:
             warnings.warn("numpy not available")
             return None
         
-        # Convert to numpy array
-        embeddings_array = np.array(embeddings)
+        # Arrays are used as-is; other array-likes are converted once to float32
+        if isinstance(embeddings, np.ndarray):
+            embeddings_array = embeddings
+        else:
+            embeddings_array = np.asarray(embeddings, dtype=np.float32)
+        
+        # Quantized input is only expanded to float32 here, for plotting
+        if scale is not None:
+            embeddings_array = (embeddings_array.astype(np.float32) - zero_point) * scale
         
         # Reduce to 3D using PCA if needed
         if embeddings_array.shape[1] > 3:
@@ -387,6 +406,9 @@ class WallVisualizer:
         hover_texts = []
         display_labels = []
         
+        if labels is None:
+            labels = (f"Point {i+1}" for i in range(len(embeddings_3d)))
+        
         for i, label in enumerate(labels):
             if isinstance(label, dict):
                 # Label is a dictionary with detailed info
@@ -470,24 +492,28 @@ class WallVisualizer:
     
     def visualize_3d_scores(
         self,
-        scores_data: List[Dict[str, Any]],
+        scores_data: Any,
         x_metric: str = "CosineSimilarity",
         y_metric: str = "ROUGEMetric",
         z_metric: str = "BLEUMetric",
         title: str = "3D Score Visualization",
         save_path: Optional[str] = None,
-        show: bool = False
+        show: bool = False,
+        meta: Optional[Dict[str, List[Any]]] = None,
     ) -> Optional[str]:
         """Visualize scores in 3D space.
         
         Args:
-            scores_data: List of score dictionaries with optional 'text', 'keywords', 'snippet' fields
+            scores_data: List of score dictionaries with optional 'text', 'keywords', 'snippet' fields,
+                or a dict mapping each metric name to a column of scores
             x_metric: Metric for x-axis
             y_metric: Metric for y-axis
             z_metric: Metric for z-axis
             title: Plot title
             save_path: Path to save HTML file
             show: Whether to display plot
+            meta: With column input, optional parallel lists for 'label', 'text',
+                'snippet', 'keywords' and 'metadata'
             
         Returns:
             Path to saved file or None
@@ -496,18 +522,44 @@ class WallVisualizer:
             warnings.warn("plotly not available")
             return None
         
-        # Extract scores
-        x_scores = [d.get(x_metric, 0) for d in scores_data]
-        y_scores = [d.get(y_metric, 0) for d in scores_data]
-        z_scores = [d.get(z_metric, 0) for d in scores_data]
+        if isinstance(scores_data, dict):
+            # Column input: metric columns are used directly, row fields come from meta
+            n = len(next(iter(scores_data.values()), []))
+            columns = [scores_data.get(m, [0] * n) for m in (x_metric, y_metric, z_metric)]
+            if NUMPY_AVAILABLE:
+                columns = [np.asarray(c, dtype=float) for c in columns]
+            x_scores, y_scores, z_scores = columns
+            meta = meta or {}
+            
+            def row_field(i: int, key: str, default: Any = None) -> Any:
+                column = meta.get(key)
+                return column[i] if column is not None else default
+        else:
+            n = len(scores_data)
+            # Extract scores into one (n, 3) array in a single pass
+            if NUMPY_AVAILABLE:
+                metrics = (x_metric, y_metric, z_metric)
+                scores_arr = np.fromiter(
+                    (d.get(m, 0) for d in scores_data for m in metrics),
+                    dtype=float,
+                    count=3 * n,
+                ).reshape(-1, 3)
+                x_scores, y_scores, z_scores = scores_arr.T
+            else:
+                x_scores = [d.get(x_metric, 0) for d in scores_data]
+                y_scores = [d.get(y_metric, 0) for d in scores_data]
+                z_scores = [d.get(z_metric, 0) for d in scores_data]
+            
+            def row_field(i: int, key: str, default: Any = None) -> Any:
+                return scores_data[i].get(key, default)
         
         # Build detailed labels and hover text
         labels = []
         hover_texts = []
         
-        for i, d in enumerate(scores_data):
+        for i in range(n):
             # Get label (prefer custom label, then text snippet, then default)
-            label = d.get('label') or d.get('snippet') or d.get('text', f'Response {i+1}')
+            label = row_field(i, 'label') or row_field(i, 'snippet') or row_field(i, 'text', f'Response {i+1}')
             if isinstance(label, str) and len(label) > 30:
                 label = label[:27] + "..."
             labels.append(label)
@@ -516,13 +568,13 @@ class WallVisualizer:
             hover_parts = [f"<b>{label}</b>"]
             
             # Add text/snippet if available
-            text = d.get('text') or d.get('snippet', '')
+            text = row_field(i, 'text') or row_field(i, 'snippet', '')
             if text:
                 snippet = text[:100] + "..." if len(text) > 100 else text
                 hover_parts.append(f"<br><b>Text:</b> {snippet}")
             
             # Add keywords if available
-            keywords = d.get('keywords', [])
+            keywords = row_field(i, 'keywords', [])
             if keywords:
                 if isinstance(keywords, str):
                     keywords = [keywords]
@@ -530,12 +582,12 @@ class WallVisualizer:
                 hover_parts.append(f"<br><b>Keywords:</b> {keywords_str}")
             
             # Add scores
-            hover_parts.append(f"<br><b>{x_metric}:</b> {d.get(x_metric, 0):.3f}")
-            hover_parts.append(f"<br><b>{y_metric}:</b> {d.get(y_metric, 0):.3f}")
-            hover_parts.append(f"<br><b>{z_metric}:</b> {d.get(z_metric, 0):.3f}")
+            hover_parts.append(f"<br><b>{x_metric}:</b> {x_scores[i]:.3f}")
+            hover_parts.append(f"<br><b>{y_metric}:</b> {y_scores[i]:.3f}")
+            hover_parts.append(f"<br><b>{z_metric}:</b> {z_scores[i]:.3f}")
             
             # Add metadata if available
-            metadata = d.get('metadata', {})
+            metadata = row_field(i, 'metadata', {})
             if metadata:
                 meta_str = ", ".join([f"{k}: {v}" for k, v in list(metadata.items())[:3]])
                 hover_parts.append(f"<br><b>Metadata:</b> {meta_str}")
@@ -599,7 +651,7 @@ class WallVisualizer:
     
     def visualize_validation_results(
         self,
-        validation_results: List[Dict[str, Any]],
+        validation_results: Any,
         title: str = "Validation Results Analysis",
         save_path: Optional[str] = None,
         show: bool = False
@@ -607,7 +659,8 @@ class WallVisualizer:
         """Visualize validation results over time.
         
         Args:
-            validation_results: List of validation result dictionaries
+            validation_results: List of validation result dictionaries, or a NumPy
+                structured array with 'passed', 'timestamp' and 'validator' fields
             title: Plot title
             save_path: Path to save figure
             show: Whether to display plot
@@ -619,9 +672,15 @@ class WallVisualizer:
             warnings.warn("matplotlib not available")
             return None
         
-        passed = [r.get('passed', False) for r in validation_results]
-        timestamps = [r.get('timestamp', i) for i, r in enumerate(validation_results)]
-        validator_names = [r.get('validator', 'Unknown') for r in validation_results]
+        if NUMPY_AVAILABLE and isinstance(validation_results, np.ndarray):
+            # Structured array: columns are used directly
+            passed = validation_results['passed'].astype(bool)
+            timestamps = validation_results['timestamp']
+            validator_names = validation_results['validator']
+        else:
+            passed = [r.get('passed', False) for r in validation_results]
+            timestamps = [r.get('timestamp', i) for i, r in enumerate(validation_results)]
+            validator_names = [r.get('validator', 'Unknown') for r in validation_results]
         
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
@@ -635,11 +694,27 @@ class WallVisualizer:
         ax1.set_yticklabels(['Failed', 'Passed'])
         ax1.grid(axis='y', alpha=0.3)
         
+        # Running success rate, computed in one vectorized pass
+        if NUMPY_AVAILABLE and len(passed):
+            passed_arr = np.asarray(passed, dtype=bool)
+            success_rate = np.cumsum(passed_arr) / np.arange(1, len(passed_arr) + 1)
+            ax1.plot(timestamps, success_rate, color='#34495e', linestyle='--', linewidth=1.5, label='Running Success Rate')
+            ax1.legend(loc='lower left')
+        
         # Validator performance
-        from collections import Counter
-        validator_counts = Counter(validator_names)
-        validators = list(validator_counts.keys())
-        counts = list(validator_counts.values())
+        if NUMPY_AVAILABLE:
+            # Counts in order of first appearance
+            names, first_index, name_counts = np.unique(
+                np.asarray(validator_names), return_index=True, return_counts=True
+            )
+            order = np.argsort(first_index)
+            validators = [str(name) for name in names[order]]
+            counts = name_counts[order].tolist()
+        else:
+            from collections import Counter
+            validator_counts = Counter(validator_names)
+            validators = list(validator_counts.keys())
+            counts = list(validator_counts.values())
         
         bars = ax2.bar(validators, counts, color='#3498db', alpha=0.8, edgecolor='black')
         ax2.set_ylabel('Number of Validations', fontsize=11, fontweight='bold')
@@ -759,18 +834,30 @@ class WallVisualizer:
         ax2.set_title('Success Rate', fontsize=12, fontweight='bold')
         ax2.axis('off')
         
+        # Latencies as one contiguous float array; summarized in a single pass
+        latencies = monitor_data.get('latencies', [])
+        latency_summary = None
+        if NUMPY_AVAILABLE:
+            latencies = np.asarray(latencies, dtype=np.float32)
+            if latencies.size:
+                latency_summary = _latency_summary(latencies)
+        
         # Average latency
         ax3 = fig.add_subplot(gs[0, 2])
-        avg_latency = monitor_data.get('avg_latency', 0)
+        avg_latency = monitor_data.get('avg_latency', latency_summary[0] if latency_summary else 0)
         ax3.text(0.5, 0.5, f'{avg_latency:.2f}s', ha='center', va='center', fontsize=48, fontweight='bold')
         ax3.set_title('Avg Latency', fontsize=12, fontweight='bold')
         ax3.axis('off')
         
         # Latency over time (if available)
         ax4 = fig.add_subplot(gs[1, :])
-        latencies = monitor_data.get('latencies', [])
-        if latencies:
+        if len(latencies):
             ax4.plot(latencies, color='#3498db', linewidth=2, marker='o', markersize=4)
+            if latency_summary:
+                _, p50, p95 = latency_summary
+                ax4.axhline(p50, color='#2ecc71', linestyle='--', linewidth=1.5, label=f'p50: {p50:.2f}s')
+                ax4.axhline(p95, color='#e67e22', linestyle='--', linewidth=1.5, label=f'p95: {p95:.2f}s')
+                ax4.legend(loc='upper right')
             ax4.set_ylabel('Latency (s)', fontsize=11, fontweight='bold')
             ax4.set_xlabel('Interaction Index', fontsize=11, fontweight='bold')
             ax4.set_title('Latency Over Time', fontsize=12, fontweight='bold')
@@ -835,17 +922,17 @@ def visualize_wordcloud(text: str, **kwargs) -> Optional[str]:
     viz = WallVisualizer()
     return viz.visualize_wordcloud(text, **kwargs)
 
-def visualize_3d_embeddings(embeddings: List[List[float]], labels: Optional[List[str]] = None, **kwargs) -> Optional[str]:
+def visualize_3d_embeddings(embeddings: Any, labels: Optional[Iterable[Any]] = None, **kwargs) -> Optional[str]:
     """Visualize embeddings in 3D."""
     viz = WallVisualizer()
     return viz.visualize_3d_embeddings(embeddings, labels, **kwargs)
 
-def visualize_3d_scores(scores_data: List[Dict[str, Any]], **kwargs) -> Optional[str]:
+def visualize_3d_scores(scores_data: Any, **kwargs) -> Optional[str]:
     """Visualize scores in 3D."""
     viz = WallVisualizer()
     return viz.visualize_3d_scores(scores_data, **kwargs)
 
-def visualize_validation_results(validation_results: List[Dict[str, Any]], **kwargs) -> Optional[str]:
+def visualize_validation_results(validation_results: Any, **kwargs) -> Optional[str]:
     """Visualize validation results."""
     viz = WallVisualizer()
     return viz.visualize_validation_results(validation_results, **kwargs)